@@ -1,6 +1,6 @@
 /**
  * Preset configurations for betting strategies.
- * Ported from Python presets.ini.
+ * Ported from Python presets.toml.
  */
 
 import { PresetConfig, StrategyConfig, LadderSpec } from "./types";
@@ -1,35 +1,56 @@
 """
 Configuration loading for betting strategy presets.
 
-Supports loading named presets from .ini files with validation
+Supports loading named presets from .toml or .ini files with validation
 and type coercion.
 """
 
-import configparser
-from dataclasses import dataclass
+import functools
+import re
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import List, Optional
-
-from simulator import BridgingPolicy, StrategyConfig, LadderSpec
-
-
-# Valid bridging policies
-VALID_POLICIES = frozenset([
-    "advance_to_next_ladder_start",
-    "carry_over_index_delta",
-    "stop_at_table_limit",
-])
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple, Union
+
+from simulator import POLICY_DISPATCH, BridgingPolicy, StrategyConfig, LadderSpec
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: only .ini presets can be read
+    tomllib = None
+
+
+# INI grammar used by preset files, matched one line at a time over the whole
+# text: a [section] header, a key = value pair, a comment or a blank line.
+# Anything else lands in the "bad" group.
+_LINE_RE = re.compile(
+    r"""
+    ^[ \t]*
+    (?:
+        \[(?P<section>[^\]]+)\]
+      | (?P<key>[A-Za-z_][\w.-]*)[ \t]*[=:][ \t]*(?P<value>.*?)
+      | [\#;].*
+      | (?P<bad>\S.*?)
+    )?
+    [ \t]*\r?$
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+# A preset file on disk, or an already-open text buffer holding one. Names
+# ending in .toml are read as TOML; anything else, including an unnamed
+# buffer, is read as INI (see _read_sections).
+PresetSource = Union[Path, TextIO]
 
 
 @dataclass(frozen=True)
 class PresetConfig:
     """
-    Immutable configuration preset loaded from .ini file.
+    Immutable configuration preset loaded from a preset file.
 
     Parameters
     ----------
     name : str
-        Name of the preset (section name in .ini file).
+        Name of the preset (section name in the preset file).
     bridging_policy : BridgingPolicy
         Bridging policy to use.
     recovery_target_pct : float
@@ -44,94 +65,331 @@ class PresetConfig:
     crossover_offset: int
 
 
-def load_preset(config_path: Path, preset_name: str) -> PresetConfig:
+# Values used for keys missing from a preset file, and returned as-is for
+# DEFAULT when no file is given
+_BUILTIN_DEFAULTS = PresetConfig(
+    name="DEFAULT",
+    bridging_policy="carry_over_index_delta",
+    recovery_target_pct=0.5,
+    crossover_offset=0,
+)
+
+
+# Preset schema, checked in order: (field, coerce, is_valid, error message).
+# Built once at import; PresetCatalog runs every preset through it.
+_PRESET_FIELDS: Tuple[
+    Tuple[str, Callable[[Any], Any], Callable[[Any], bool], str], ...
+] = (
+    (
+        "bridging_policy",
+        str,
+        POLICY_DISPATCH.__contains__,
+        "Invalid bridging_policy '{value}'. "
+        f"Must be one of: {list(POLICY_DISPATCH)}",
+    ),
+    (
+        "recovery_target_pct",
+        float,
+        lambda pct: 0 < pct <= 1,
+        "recovery_target_pct must be in (0, 1], got {value}",
+    ),
+    (
+        "crossover_offset",
+        int,
+        lambda offset: offset >= 0,
+        "crossover_offset must be >= 0, got {value}",
+    ),
+)
+
+
+def _read_buffer(buffer: TextIO) -> str:
+    """Return the whole text of a buffer, keeping its current position."""
+    position = buffer.tell()
+    buffer.seek(0)
+    try:
+        return buffer.read()
+    finally:
+        buffer.seek(position)
+
+
+def _parse_ini(source: PresetSource) -> Dict[str, Dict[str, str]]:
     """
-    Load a named preset from INI file.
+    Parse a flat INI file into a mapping of section name to key/value pairs.
+
+    Handles the subset of INI used by preset files: section headers,
+    ``key = value`` (or ``key: value``) lines, blank lines and full-line
+    ``#``/``;`` comments. Keys are lower-cased as ``configparser`` does.
 
     Parameters
     ----------
-    config_path : Path
-        Path to the .ini configuration file.
-    preset_name : str
-        Name of the preset section to load.
+    source : PresetSource
+        Path to the .ini preset file, or a text buffer holding one.
+        A buffer is parsed whole, from its start, and left at the position
+        it had before the call.
 
     Returns
     -------
-    PresetConfig
-        Immutable configuration object with validated values.
+    Dict[str, Dict[str, str]]
+        Raw string values per section, including DEFAULT if present.
+
+    Raises
+    ------
+    ValueError
+        If a line is malformed or a key appears before any section.
+    """
+    sections: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+    if isinstance(source, Path):
+        text = source.read_text(encoding="utf-8")
+    else:
+        text = _read_buffer(source)
+
+    for match in _LINE_RE.finditer(text):
+        section, key, bad = match.group("section", "key", "bad")
+        if section is not None:
+            current = sections.setdefault(section, {})
+        elif key is not None:
+            if current is None:
+                line_no = text.count("\n", 0, match.start()) + 1
+                raise ValueError(
+                    f"Key outside of any section at line {line_no} in {source}"
+                )
+            current[key.lower()] = match.group("value")
+        elif bad is not None:
+            line_no = text.count("\n", 0, match.start()) + 1
+            raise ValueError(
+                f"Malformed line {line_no} in {source}: {match.group(0).rstrip()}"
+            )
+
+    return sections
+
+
+def _parse_toml(source: PresetSource) -> Dict[str, Dict[str, str]]:
+    """
+    Parse a TOML preset file into a mapping of table name to key/value pairs.
+
+    Each top-level table is a preset. Values are converted back to strings
+    so TOML and INI presets go through the same schema coercion; a TOML
+    ``2.5`` for an integer field is rejected rather than truncated.
+
+    Parameters
+    ----------
+    source : PresetSource
+        Path to the .toml preset file, or a text buffer holding one.
+        A buffer is parsed whole, from its start, and left at the position
+        it had before the call.
+
+    Returns
+    -------
+    Dict[str, Dict[str, str]]
+        Raw string values per table, including DEFAULT if present.
+
+    Raises
+    ------
+    ImportError
+        If ``tomllib`` is unavailable (Python < 3.11).
+    ValueError
+        If the file is not valid TOML or a key sits outside any table.
+    """
+    if tomllib is None:
+        raise ImportError("Reading .toml presets requires Python 3.11+")
+    if isinstance(source, Path):
+        with source.open("rb") as f:
+            data = tomllib.load(f)
+    else:
+        data = tomllib.loads(_read_buffer(source))
+
+    sections: Dict[str, Dict[str, str]] = {}
+    for name, table in data.items():
+        if not isinstance(table, dict):
+            raise ValueError(f"Key '{name}' outside of any table in {source}")
+        sections[name] = {key.lower(): str(value) for key, value in table.items()}
+    return sections
+
+
+def _read_sections(source: PresetSource) -> Dict[str, Dict[str, str]]:
+    """Parse a preset file as TOML or INI, chosen by its file suffix."""
+    name = source if isinstance(source, Path) else getattr(source, "name", "")
+    if str(name).lower().endswith(".toml"):
+        return _parse_toml(source)
+    return _parse_ini(source)
+
+
+class PresetCatalog:
+    """
+    Parsed preset file serving validated presets by name.
+
+    The file is parsed once on construction and each preset is validated
+    the first time it is requested. Hold on to a catalog when loading many
+    presets from the same file; ``load_preset`` and ``list_presets`` share
+    catalogs between calls and rebuild them when the file changes.
+
+    Parameters
+    ----------
+    config_path : PresetSource
+        Path to the .toml or .ini preset file, or a text buffer holding one.
 
     Raises
     ------
     FileNotFoundError
         If the config file does not exist.
     ValueError
-        If preset not found or validation fails.
+        If a line of the file is malformed.
 
     Examples
     --------
-    >>> preset = load_preset(Path("presets.ini"), "aggressive")
-    >>> preset.recovery_target_pct
-    0.75
+    >>> catalog = PresetCatalog(Path("presets.toml"))
+    >>> catalog.get("aggressive").crossover_offset
+    2
     """
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
-
-    parser = configparser.ConfigParser()
-    parser.read(config_path)
 
-    # Check if preset exists (DEFAULT is always available)
-    if preset_name != "DEFAULT" and preset_name not in parser.sections():
-        available = ["DEFAULT"] + parser.sections()
-        raise ValueError(
-            f"Preset '{preset_name}' not found. Available presets: {available}"
+    def __init__(self, config_path: PresetSource) -> None:
+        self.path = config_path
+        self._sections = _read_sections(config_path)
+        self._presets: Dict[str, PresetConfig] = {}
+        self._names = ("DEFAULT",) + tuple(
+            s for s in self._sections if s != "DEFAULT"
         )
 
-    # Get values with defaults from DEFAULT section
-    section = parser[preset_name] if preset_name != "DEFAULT" else parser.defaults()
+    def list(self) -> List[str]:
+        """Return all preset names, DEFAULT first."""
+        return list(self._names)
+
+    def get(self, preset_name: str) -> PresetConfig:
+        """
+        Return the validated preset with the given name.
+
+        Parameters
+        ----------
+        preset_name : str
+            Name of the preset section to load.
+
+        Returns
+        -------
+        PresetConfig
+            Immutable configuration object with validated values.
+
+        Raises
+        ------
+        ValueError
+            If preset not found or validation fails.
+        """
+        preset = self._presets.get(preset_name)
+        if preset is None:
+            preset = self._build(preset_name)
+            self._presets[preset_name] = preset
+        return preset
+
+    def _build(self, preset_name: str) -> PresetConfig:
+        """Merge a section over DEFAULT and validate it."""
+        sections = self._sections
+        defaults = sections.get("DEFAULT", {})
+
+        # Check if preset exists (DEFAULT is always available)
+        if preset_name not in self._names:
+            raise ValueError(
+                f"Preset '{preset_name}' not found. Available presets: {self.list()}"
+            )
+
+        # Get values with defaults from DEFAULT section
+        section = {**defaults, **sections.get(preset_name, {})}
+
+        # Coerce and check each field against the preset schema
+        values = {}
+        for field_name, coerce, is_valid, message in _PRESET_FIELDS:
+            raw = section.get(field_name, getattr(_BUILTIN_DEFAULTS, field_name))
+            try:
+                value = coerce(raw)
+            except ValueError as e:
+                raise ValueError(f"Invalid {field_name}: {e}") from e
+            if not is_valid(value):
+                raise ValueError(message.format(value=value))
+            values[field_name] = value
+
+        return PresetConfig(name=preset_name, **values)
+
+
+@functools.lru_cache(maxsize=32)
+def _catalog_cached(path_str: str, mtime_ns: int, size: int) -> PresetCatalog:
+    """
+    Memoized ``PresetCatalog`` construction.
 
-    # Parse bridging_policy
-    policy = section.get("bridging_policy", "carry_over_index_delta")
-    if policy not in VALID_POLICIES:
-        raise ValueError(
-            f"Invalid bridging_policy '{policy}'. Must be one of: {VALID_POLICIES}"
-        )
+    ``mtime_ns`` and ``size`` only take part in the cache key, so an edited
+    file misses the cache and is parsed again.
+    """
+    return PresetCatalog(Path(path_str))
 
-    # Parse recovery_target_pct
-    try:
-        recovery_pct = float(section.get("recovery_target_pct", "0.5"))
-    except ValueError as e:
-        raise ValueError(f"Invalid recovery_target_pct: {e}") from e
 
-    if not 0 < recovery_pct <= 1:
-        raise ValueError(
-            f"recovery_target_pct must be in (0, 1], got {recovery_pct}"
-        )
+def _get_catalog(config_path: Path) -> PresetCatalog:
+    """
+    Return the shared catalog for a preset file, reusing earlier parses.
 
-    # Parse crossover_offset
+    The catalog also caches each validated preset, so repeat lookups of the
+    same preset in an unchanged file cost one ``stat`` call.
+    """
     try:
-        offset = int(section.get("crossover_offset", "0"))
-    except ValueError as e:
-        raise ValueError(f"Invalid crossover_offset: {e}") from e
-
-    if offset < 0:
-        raise ValueError(f"crossover_offset must be >= 0, got {offset}")
-
-    return PresetConfig(
-        name=preset_name,
-        bridging_policy=policy,  # type: ignore[arg-type]
-        recovery_target_pct=recovery_pct,
-        crossover_offset=offset,
+        stat = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+    return _catalog_cached(
+        str(config_path.resolve()), stat.st_mtime_ns, stat.st_size
     )
 
 
-def list_presets(config_path: Path) -> List[str]:
+def load_preset(
+    config_path: Optional[PresetSource], preset_name: str = "DEFAULT"
+) -> PresetConfig:
+    """
+    Load a named preset from a TOML or INI preset file.
+
+    Parameters
+    ----------
+    config_path : Optional[PresetSource]
+        Path to the .toml or .ini preset file, or a text buffer holding one.
+        ``None`` means no file: the built-in DEFAULT preset is returned
+        without touching disk.
+    preset_name : str
+        Name of the preset section to load.
+
+    Returns
+    -------
+    PresetConfig
+        Immutable configuration object with validated values.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the config file does not exist.
+    ValueError
+        If preset not found or validation fails.
+
+    Examples
+    --------
+    >>> preset = load_preset(Path("presets.toml"), "aggressive")
+    >>> preset.recovery_target_pct
+    0.75
+    """
+    if config_path is None:
+        if preset_name != "DEFAULT":
+            raise ValueError(
+                f"Preset '{preset_name}' not found. Available presets: ['DEFAULT']"
+            )
+        return _BUILTIN_DEFAULTS
+
+    if not isinstance(config_path, Path):
+        return PresetCatalog(config_path).get(preset_name)
+
+    return _get_catalog(config_path).get(preset_name)
+
+
+def list_presets(config_path: PresetSource) -> List[str]:
     """
-    List all available preset names from an INI file.
+    List all available preset names from a TOML or INI preset file.
 
     Parameters
     ----------
-    config_path : Path
-        Path to the .ini configuration file.
+    config_path : PresetSource
+        Path to the .toml or .ini preset file, or a text buffer holding one.
 
     Returns
     -------
@@ -145,17 +403,51 @@ def list_presets(config_path: Path) -> List[str]:
 
     Examples
     --------
-    >>> presets = list_presets(Path("presets.ini"))
+    >>> presets = list_presets(Path("presets.toml"))
     >>> "aggressive" in presets
     True
     """
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    if not isinstance(config_path, Path):
+        return PresetCatalog(config_path).list()
+
+    return _get_catalog(config_path).list()
+
+
+def load_all_presets(config_path: PresetSource) -> Dict[str, PresetConfig]:
+    """
+    Load and validate every preset in a TOML or INI preset file.
+
+    The file is parsed once; presets are validated in file order, DEFAULT
+    first.
+
+    Parameters
+    ----------
+    config_path : PresetSource
+        Path to the .toml or .ini preset file, or a text buffer holding one.
+
+    Returns
+    -------
+    Dict[str, PresetConfig]
+        Validated presets keyed by name.
 
-    parser = configparser.ConfigParser()
-    parser.read(config_path)
+    Raises
+    ------
+    FileNotFoundError
+        If the config file does not exist.
+    ValueError
+        If any preset fails validation.
 
-    return ["DEFAULT"] + parser.sections()
+    Examples
+    --------
+    >>> presets = load_all_presets(Path("presets.toml"))
+    >>> presets["aggressive"].crossover_offset
+    2
+    """
+    if isinstance(config_path, Path):
+        catalog = _get_catalog(config_path)
+    else:
+        catalog = PresetCatalog(config_path)
+    return {name: catalog.get(name) for name in catalog.list()}
 
 
 def create_strategy_from_preset(
@@ -179,7 +471,7 @@ def create_strategy_from_preset(
 
     Examples
     --------
-    >>> preset = load_preset(Path("presets.ini"), "aggressive")
+    >>> preset = load_preset(Path("presets.toml"), "aggressive")
     >>> ladders = [LadderSpec("L1", [10, 20, 30])]
     >>> strategy = create_strategy_from_preset(preset, ladders)
     >>> strategy.recovery_target_pct
@@ -218,17 +510,14 @@ def merge_cli_with_preset(
     PresetConfig
         New preset with CLI overrides applied.
     """
-    policy = cli_policy if cli_policy is not None else preset.bridging_policy
-    recovery_pct = (
-        cli_recovery_pct
-        if cli_recovery_pct is not None
-        else preset.recovery_target_pct
-    )
-    offset = cli_offset if cli_offset is not None else preset.crossover_offset
-
-    return PresetConfig(
-        name=f"{preset.name}+cli",
-        bridging_policy=policy,  # type: ignore[arg-type]
-        recovery_target_pct=recovery_pct,
-        crossover_offset=offset,
-    )
+    cli_values = {
+        "bridging_policy": cli_policy,
+        "recovery_target_pct": cli_recovery_pct,
+        "crossover_offset": cli_offset,
+    }
+    overrides = {
+        field_name: value
+        for field_name, value in cli_values.items()
+        if value is not None
+    }
+    return replace(preset, name=f"{preset.name}+cli", **overrides)
@@ -9,7 +9,7 @@ import logging
 import os
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
 
 class EventType(Enum):
@@ -197,6 +197,11 @@ class SimulatorLogger:
 
     def __init__(self, logger: Optional[logging.Logger] = None) -> None:
         self._logger = logger or get_simulator_logger()
+        # Level checks are resolved once per instance so disabled events
+        # cost a single attribute test; create a new SimulatorLogger after
+        # reconfiguring levels.
+        self._info_enabled = self._logger.isEnabledFor(logging.INFO)
+        self._debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
 
     def log_recovery_enter(
         self,
@@ -222,9 +227,12 @@ class SimulatorLogger:
         index : int
             Current stake index.
         """
+        if not self._info_enabled:
+            return
         self._logger.info(
-            f"[RECOVERY_ENTER] pnl={pnl:.2f} target={target:.2f} "
-            f"recovery_pct={recovery_pct} ladder={ladder} index={index}"
+            "[RECOVERY_ENTER] pnl=%.2f target=%.2f "
+            "recovery_pct=%s ladder=%d index=%d",
+            pnl, target, recovery_pct, ladder, index,
         )
 
     def log_recovery_exit(
@@ -245,11 +253,19 @@ class SimulatorLogger:
         rounds_in_recovery : Optional[int]
             Number of rounds spent in recovery mode.
         """
-        msg = f"[RECOVERY_EXIT] pnl={pnl:.2f} target={target:.2f}"
-        if rounds_in_recovery is not None:
-            msg += f" rounds_in_recovery={rounds_in_recovery}"
-        msg += " reset_to=L0[0]"
-        self._logger.info(msg)
+        if not self._info_enabled:
+            return
+        if rounds_in_recovery is None:
+            self._logger.info(
+                "[RECOVERY_EXIT] pnl=%.2f target=%.2f reset_to=L0[0]",
+                pnl, target,
+            )
+        else:
+            self._logger.info(
+                "[RECOVERY_EXIT] pnl=%.2f target=%.2f "
+                "rounds_in_recovery=%d reset_to=L0[0]",
+                pnl, target, rounds_in_recovery,
+            )
 
     def log_ladder_bridge(
         self,
@@ -278,13 +294,18 @@ class SimulatorLogger:
         stake : Optional[float]
             Current stake value at destination.
         """
-        msg = (
-            f"[LADDER_BRIDGE] from=L{from_ladder}[{from_index}] "
-            f"to=L{to_ladder}[{to_index}] offset={offset}"
-        )
-        if stake is not None:
-            msg += f" stake={stake:.2f}"
-        self._logger.info(msg)
+        if not self._info_enabled:
+            return
+        if stake is None:
+            self._logger.info(
+                "[LADDER_BRIDGE] from=L%d[%d] to=L%d[%d] offset=%d",
+                from_ladder, from_index, to_ladder, to_index, offset,
+            )
+        else:
+            self._logger.info(
+                "[LADDER_BRIDGE] from=L%d[%d] to=L%d[%d] offset=%d stake=%.2f",
+                from_ladder, from_index, to_ladder, to_index, offset, stake,
+            )
 
     def log_state_change(
         self,
@@ -310,8 +331,34 @@ class SimulatorLogger:
         stake : float
             Stake for the round.
         """
-        outcome = "WIN" if won else "LOSS"
+        if not self._debug_enabled:
+            return
         self._logger.debug(
-            f"[STATE_CHANGE] L{ladder}[{index}] pnl={pnl:.2f} "
-            f"{outcome} stake={stake:.2f}"
+            "[STATE_CHANGE] L%d[%d] pnl=%.2f %s stake=%.2f",
+            ladder, index, pnl, "WIN" if won else "LOSS", stake,
         )
+
+
+class NullSimulatorLogger:
+    """
+    Drop-in replacement for ``SimulatorLogger`` that discards every event.
+
+    Used when the simulator logger is not enabled for INFO, so sessions
+    skip both logger construction and the per-event level checks.
+    """
+
+    def log_recovery_enter(self, *args: Any, **kwargs: Any) -> None:
+        """Discard a recovery mode entry event."""
+
+    def log_recovery_exit(self, *args: Any, **kwargs: Any) -> None:
+        """Discard a recovery mode exit event."""
+
+    def log_ladder_bridge(self, *args: Any, **kwargs: Any) -> None:
+        """Discard a ladder transition event."""
+
+    def log_state_change(self, *args: Any, **kwargs: Any) -> None:
+        """Discard a step-by-step state change event."""
+
+
+# Shared instance; the null logger holds no state
+NULL_SIMULATOR_LOGGER = NullSimulatorLogger()
@@ -34,24 +34,39 @@ USAGE:
 python simulator.py --bankroll 800000 --n-sessions 100000 --alpha 0.01
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Literal, Tuple, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, replace
+from enum import IntEnum
+from functools import lru_cache
+from typing import List, Optional, Literal, Sequence, Tuple, Dict, Any, Union
 import numpy as np
 from scipy import stats
 import json
+import logging
+import os
 import argparse
 from pathlib import Path
 import csv
 from datetime import datetime
 
-from logging_config import SimulatorLogger, configure_simulator_logging
+from logging_config import (
+    NULL_SIMULATOR_LOGGER,
+    SimulatorLogger,
+    configure_simulator_logging,
+    get_simulator_logger,
+)
+
+try:
+    import orjson
+except ImportError:  # Optional faster JSON encoder
+    orjson = None
 
 
 # ============================================================================
 # Core Data Structures
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class GameSpec:
     """Specification for a betting game."""
     name: str
@@ -76,13 +91,15 @@ class GameSpec:
             return False, -stake
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LadderSpec:
     """Specification for a stake ladder."""
     name: str
-    stakes: List[float]
+    stakes: Tuple[float, ...]
     
     def __post_init__(self):
+        # Immutable (stakes stored as a tuple), so ladders can be shared freely
+        object.__setattr__(self, "stakes", tuple(self.stakes))
         if not self.stakes:
             raise ValueError("Ladder must have at least one stake")
         if any(s <= 0 for s in self.stakes):
@@ -104,24 +121,78 @@ BridgingPolicy = Literal[
 ]
 
 
-@dataclass
+class _PolicyId(IntEnum):
+    """Integer ids for bridging policies, resolved once per strategy."""
+    ADVANCE = 0
+    CARRY = 1
+    STOP = 2
+
+
+# Valid bridging policies and their ids; lookup validates and dispatches
+POLICY_DISPATCH: Dict[str, _PolicyId] = {
+    "advance_to_next_ladder_start": _PolicyId.ADVANCE,
+    "carry_over_index_delta": _PolicyId.CARRY,
+    "stop_at_table_limit": _PolicyId.STOP,
+}
+
+
+# StrategyConfig field checks, built once and run in order on construction
+_STRATEGY_CHECKS = (
+    (lambda c: bool(c.ladders), "Strategy must have at least one ladder"),
+    (
+        lambda c: 0 < c.recovery_target_pct <= 1,
+        "recovery_target_pct must be in (0, 1]",
+    ),
+    (lambda c: c.crossover_offset >= 0, "crossover_offset must be non-negative"),
+)
+
+
+@dataclass(slots=True)
 class StrategyConfig:
     """Configuration for the betting strategy."""
-    ladders: List[LadderSpec]
+    ladders: Sequence[LadderSpec]
     bridging_policy: BridgingPolicy = "advance_to_next_ladder_start"
     recovery_target_pct: float = 0.5  # % of loss to recover
     crossover_offset: int = 0  # Index offset in next ladder
 
+    # Derived lookup tables, built once from ``ladders``
+    _max_index: np.ndarray = field(init=False, repr=False, compare=False)
+    _stakes_flat: np.ndarray = field(init=False, repr=False, compare=False)
+    _ladder_offsets: np.ndarray = field(init=False, repr=False, compare=False)
+    _ladder_lens: np.ndarray = field(init=False, repr=False, compare=False)
+    _policy_id: _PolicyId = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        if not self.ladders:
-            raise ValueError("Strategy must have at least one ladder")
-        if not 0 < self.recovery_target_pct <= 1:
-            raise ValueError("recovery_target_pct must be in (0, 1]")
-        if self.crossover_offset < 0:
-            raise ValueError("crossover_offset must be non-negative")
+        for is_valid, message in _STRATEGY_CHECKS:
+            if not is_valid(self):
+                raise ValueError(message)
+        policy_id = POLICY_DISPATCH.get(self.bridging_policy)
+        if policy_id is None:
+            raise ValueError(f"Unknown bridging policy: {self.bridging_policy}")
+        self._policy_id = policy_id
+
+        # Flat stakes shared by every engine: ladders laid end to end, ladder
+        # l starting at _ladder_offsets[l]
+        self._max_index = np.array(
+            [ladder.max_index for ladder in self.ladders], dtype=np.int32
+        )
+        self._ladder_lens = np.array(
+            [len(ladder.stakes) for ladder in self.ladders], dtype=np.int64
+        )
+        self._ladder_offsets = np.zeros(len(self.ladders), dtype=np.int64)
+        np.cumsum(self._ladder_lens[:-1], out=self._ladder_offsets[1:])
+        self._stakes_flat = np.concatenate(
+            [np.asarray(ladder.stakes, dtype=np.float64) for ladder in self.ladders]
+        )
 
+    def get_stake(self, ladder: int, index: int) -> float:
+        """Get stake at (ladder, index), with index clamped to the ladder."""
+        max_index = self._max_index[ladder]
+        offset = self._ladder_offsets[ladder]
+        return float(self._stakes_flat[offset + max(0, min(index, max_index))])
 
-@dataclass
+
+@dataclass(slots=True)
 class SessionConfig:
     """Configuration for a single session."""
     bankroll: float
@@ -145,7 +216,7 @@ class SessionConfig:
             raise ValueError("Table max must be positive if specified")
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionResult:
     """Results from a single session."""
     # Stop reasons
@@ -168,10 +239,75 @@ class SessionResult:
     final_ladder: int
     final_index: int
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a flat dictionary; ladder touches become a list."""
+        return {
+            "hit_target": self.hit_target,
+            "hit_stop_loss": self.hit_stop_loss,
+            "hit_max_rounds": self.hit_max_rounds,
+            "hit_table_limit": self.hit_table_limit,
+            "bankroll_exhausted": self.bankroll_exhausted,
+            "final_pnl": self.final_pnl,
+            "rounds_played": self.rounds_played,
+            "total_wagered": self.total_wagered,
+            "max_stake_seen": self.max_stake_seen,
+            "max_drawdown": self.max_drawdown,
+            "ladder_touches": list(self.ladder_touches.values()),
+            "top_of_ladder_touches": self.top_of_ladder_touches,
+            "final_ladder": self.final_ladder,
+            "final_index": self.final_index,
+        }
+
+
+# Uniform draw block sizes for SessionSimulator: short sessions pay for a
+# small first block, long ones quickly reach the largest block
+_FIRST_UNIFORM_BLOCK = 64
+_MAX_UNIFORM_BLOCK = 4096
+
 
 class SessionSimulator:
     """Simulates a single betting session using the loss-recovery strategy."""
 
+    # Per-round state lives in slots. Packing it into a NumPy record or a
+    # list is slower in CPython; the batch engines keep state as arrays.
+    __slots__ = (
+        "strategy",
+        "config",
+        "rng",
+        "_p_win",
+        "_payout",
+        "_bankroll",
+        "_profit_target",
+        "_stop_loss",
+        "_max_rounds",
+        "_table_max",
+        "_stakes",
+        "_max_indices",
+        "_last_ladder",
+        "_policy_id",
+        "_recovery_pct",
+        "_crossover_offset",
+        "_step",
+        "_rand_block",
+        "_uniforms",
+        "_rand_pos",
+        "current_ladder",
+        "current_index",
+        "pnl",
+        "rounds",
+        "total_wagered",
+        "max_stake",
+        "max_drawdown",
+        "peak_pnl",
+        "ladder_touches",
+        "top_touches",
+        "stopped",
+        "stop_reason",
+        "in_recovery",
+        "recovery_target_pnl",
+        "_logger",
+    )
+
     def __init__(
         self,
         strategy: StrategyConfig,
@@ -183,22 +319,72 @@ class SessionSimulator:
         self.config = config
         self.rng = rng
 
+        # Bet resolution inputs, bound once for the per-round hot path
+        self._p_win = config.game_spec.p_win
+        self._payout = config.game_spec.payout_ratio
+
+        # Session limits and ladder layout, bound once instead of per round
+        self._bankroll = config.bankroll
+        self._profit_target = config.profit_target
+        self._stop_loss = config.stop_loss_abs
+        self._max_rounds = config.max_rounds
+        self._table_max = (
+            float("inf") if config.table_max is None else config.table_max
+        )
+        flat = strategy._stakes_flat.tolist()
+        self._stakes: List[List[float]] = [
+            flat[offset:offset + length]
+            for offset, length in zip(
+                strategy._ladder_offsets.tolist(), strategy._ladder_lens.tolist()
+            )
+        ]
+        self._max_indices: List[int] = strategy._max_index.tolist()
+        self._last_ladder = len(strategy.ladders) - 1
+        self._policy_id = strategy._policy_id
+        self._recovery_pct = strategy.recovery_target_pct
+        self._crossover_offset = strategy.crossover_offset
+        self._step = _STEP_FUNCTIONS[strategy._policy_id]
+
+        # Mutable session state: position, tracking and recovery mode
+        self.reset_state()
+
+        # Logger for recovery and bridging events; a no-op one when disabled
+        logger = get_simulator_logger()
+        if logger.isEnabledFor(logging.INFO):
+            self._logger = SimulatorLogger(logger)
+        else:
+            self._logger = NULL_SIMULATOR_LOGGER
+
+    def reset_state(
+        self,
+        ladder: int = 0,
+        index: int = 0,
+        pnl: float = 0.0,
+        rng_seed: Optional[int] = None,
+    ) -> None:
+        """Return to a fresh session at (ladder, index, pnl), optionally reseeding."""
+        if rng_seed is not None:
+            self.rng = make_rng(rng_seed)
+
+        # Uniforms are drawn in blocks; refilled when the cursor runs out
+        self._rand_block = _FIRST_UNIFORM_BLOCK
+        self._uniforms: List[float] = []
+        self._rand_pos = 0
+
         # Position tracking
-        self.current_ladder = 0
-        self.current_index = 0
+        self.current_ladder = ladder
+        self.current_index = index
 
         # Performance tracking
-        self.pnl = 0.0
+        self.pnl = pnl
         self.rounds = 0
         self.total_wagered = 0.0
         self.max_stake = 0.0
         self.max_drawdown = 0.0
         self.peak_pnl = 0.0
 
-        # Ladder statistics
-        self.ladder_touches: Dict[int, int] = {
-            i: 0 for i in range(len(strategy.ladders))
-        }
+        # Ladder statistics (dense per-ladder counters, indexed by ladder)
+        self.ladder_touches: List[int] = [0] * len(self._max_indices)
         self.top_touches = 0
 
         # Session control
@@ -209,19 +395,18 @@ class SessionSimulator:
         self.in_recovery = False
         self.recovery_target_pnl = 0.0
 
-        # Logger for recovery and bridging events
-        self._logger = SimulatorLogger()
-
     @property
     def current_stake(self) -> float:
         """Get the current stake based on ladder position."""
-        ladder = self.strategy.ladders[self.current_ladder]
-        return ladder.get_stake(self.current_index)
+        ladder = self.current_ladder
+        index = self.current_index
+        top = self._max_indices[ladder]
+        index = 0 if index < 0 else (top if index > top else index)
+        return self._stakes[ladder][index]
 
     def can_afford_stake(self) -> bool:
         """Check if current bankroll can afford the current stake."""
-        current_bankroll = self.config.bankroll + self.pnl
-        return current_bankroll >= self.current_stake
+        return self._bankroll + self.pnl >= self.current_stake
 
     def step_index(self, won: bool) -> bool:
         """
@@ -237,126 +422,25 @@ class SessionSimulator:
         - carry_over_index_delta: Enter recovery mode, advance with offset
         - stop_at_table_limit: Treat as table limit hit and stop
 
+        The policy-specific step function is chosen once in ``__init__``.
+
         Returns:
             True if session should stop
         """
-        current_ladder_spec = self.strategy.ladders[self.current_ladder]
-        max_index = current_ladder_spec.max_index
-
-        # Check if at top before stepping
-        at_top_before_step = (self.current_index == max_index)
-
-        # Base stepping logic
-        if won:
-            self.current_index -= 2
-        else:
-            self.current_index += 1
-
-        # Check if bridging needed (lost at top)
-        need_bridging = (not won) and at_top_before_step
-
-        if need_bridging:
-            # Track that we hit top of ladder
-            self.top_touches += 1
-
-            # Check if at last ladder
-            at_last_ladder = (self.current_ladder == len(self.strategy.ladders) - 1)
-
-            # Apply bridging policy
-            if self.strategy.bridging_policy == "advance_to_next_ladder_start":
-                if at_last_ladder:
-                    # Can't advance further - stop with table limit
-                    self.stopped = True
-                    self.stop_reason = "table_limit"
-                    return True
-                else:
-                    # Advance to next ladder at index 0
-                    self.current_ladder += 1
-                    self.current_index = 0
-
-            elif self.strategy.bridging_policy == "carry_over_index_delta":
-                # Enter or maintain recovery mode
-                if not self.in_recovery:
-                    # Enter recovery mode
-                    self.in_recovery = True
-                    # Recovery target: current_pnl + (abs(current_pnl) * recovery_target_pct)
-                    if self.pnl < 0:
-                        recovery_amount = abs(self.pnl) * self.strategy.recovery_target_pct
-                        self.recovery_target_pnl = self.pnl + recovery_amount
-                    else:
-                        # Edge case: in profit, no recovery needed
-                        self.recovery_target_pnl = self.pnl
-
-                    # Log recovery mode entry
-                    self._logger.log_recovery_enter(
-                        pnl=self.pnl,
-                        target=self.recovery_target_pnl,
-                        recovery_pct=self.strategy.recovery_target_pct,
-                        ladder=self.current_ladder,
-                        index=self.current_index,
-                    )
-
-                # Advance to next ladder (or stop if at last)
-                if at_last_ladder:
-                    self.stopped = True
-                    self.stop_reason = "table_limit"
-                    return True
-                else:
-                    old_ladder = self.current_ladder
-                    old_index = self.current_index
-                    self.current_ladder += 1
-                    # Start at crossover_offset index in next ladder
-                    self.current_index = self.strategy.crossover_offset
-
-                    # Log ladder bridge
-                    self._logger.log_ladder_bridge(
-                        from_ladder=old_ladder,
-                        from_index=old_index,
-                        to_ladder=self.current_ladder,
-                        to_index=self.current_index,
-                        offset=self.strategy.crossover_offset,
-                        stake=self.current_stake,
-                    )
-
-            elif self.strategy.bridging_policy == "stop_at_table_limit":
-                # Treat as hard stop
-                self.stopped = True
-                self.stop_reason = "table_limit"
-                return True
-
-            else:
-                raise ValueError(f"Unknown bridging policy: {self.strategy.bridging_policy}")
-
-        else:
-            # Normal stepping - clamp to valid range
-            self.current_index = max(0, min(self.current_index, max_index))
-
-            # Check for recovery completion (only for carry_over_index_delta)
-            if self.in_recovery and self.pnl >= self.recovery_target_pnl:
-                # Log recovery exit before resetting
-                self._logger.log_recovery_exit(
-                    pnl=self.pnl,
-                    target=self.recovery_target_pnl,
-                )
-                # Recovery achieved - reset to ladder 0, index 0
-                self.in_recovery = False
-                self.recovery_target_pnl = 0.0
-                self.current_ladder = 0
-                self.current_index = 0
-
-        return False
+        return self._step(self, won)
 
     def play_round(self) -> bool:
         """Play one round. Returns True if session should continue."""
+        stake = self.current_stake
+
         # Check affordability - if can't afford, bankroll exhausted
-        if not self.can_afford_stake():
+        if self._bankroll + self.pnl < stake:
             self.stopped = True
             self.stop_reason = "bankroll_exhausted"
             return False
         
         # Check table limit
-        stake = self.current_stake
-        if self.config.table_max is not None and stake > self.config.table_max:
+        if stake > self._table_max:
             self.stopped = True
             self.stop_reason = "table_limit"
             return False
@@ -366,9 +450,17 @@ class SessionSimulator:
         self.max_stake = max(self.max_stake, stake)
         self.total_wagered += stake
         
-        # Resolve bet
-        won, round_pnl = self.config.game_spec.resolve_bet(stake, self.rng)
-        self.pnl += round_pnl
+        # Resolve bet (inlined GameSpec.resolve_bet)
+        pos = self._rand_pos
+        if pos == len(self._uniforms):
+            # Blocks double up to a cap and never run past max_rounds
+            n = max(1, min(self._rand_block, self._max_rounds - self.rounds))
+            self._uniforms = self.rng.random(n).tolist()
+            self._rand_block = min(2 * self._rand_block, _MAX_UNIFORM_BLOCK)
+            pos = 0
+        won = self._uniforms[pos] < self._p_win
+        self._rand_pos = pos + 1
+        self.pnl += stake * self._payout if won else -stake
         self.rounds += 1
         
         # Update drawdown tracking
@@ -377,35 +469,47 @@ class SessionSimulator:
         self.max_drawdown = max(self.max_drawdown, drawdown)
         
         # Check profit target
-        if self.pnl >= self.config.profit_target:
+        if self.pnl >= self._profit_target:
             self.stopped = True
             self.stop_reason = "profit_target"
             return False
         
         # Check stop loss
-        if -self.pnl >= self.config.stop_loss_abs:
+        if -self.pnl >= self._stop_loss:
             self.stopped = True
             self.stop_reason = "stop_loss"
             return False
         
         # Check max rounds
-        if self.rounds >= self.config.max_rounds:
+        if self.rounds >= self._max_rounds:
             self.stopped = True
             self.stop_reason = "max_rounds"
             return False
         
         # Step the index
-        should_stop = self.step_index(won)
+        should_stop = self._step(self, won)
         if should_stop:
             return False
         
         return True
     
+    def run_until_stopped(self, max_rounds: int) -> Tuple[float, int, bool]:
+        """
+        Play up to max_rounds rounds; return (pnl, rounds, stopped).
+
+        A session that has already stopped plays no further rounds.
+        """
+        play = self.play_round
+        played = 0
+        while not self.stopped and played < max_rounds and play():
+            played += 1
+        return self.pnl, self.rounds, self.stopped
+
     def run(self) -> SessionResult:
         """Run a complete session and return results."""
-        while not self.stopped:
-            self.play_round()
-        
+        # A fresh session always stops by its own max_rounds check
+        self.run_until_stopped(self._max_rounds)
+
         return SessionResult(
             hit_target=(self.stop_reason == "profit_target"),
             hit_stop_loss=(self.stop_reason == "stop_loss"),
@@ -417,13 +521,437 @@ class SessionSimulator:
             total_wagered=self.total_wagered,
             max_stake_seen=self.max_stake,
             max_drawdown=self.max_drawdown,
-            ladder_touches=self.ladder_touches,
+            ladder_touches=dict(enumerate(self.ladder_touches)),
             top_of_ladder_touches=self.top_touches,
             final_ladder=self.current_ladder,
             final_index=self.current_index,
         )
 
 
+# Per-policy step functions. Each handles one bridging policy so the policy
+# branch is resolved once per session rather than once per round.
+
+def _step_advance(sim: SessionSimulator, won: bool) -> bool:
+    """Step under advance_to_next_ladder_start. Returns True to stop."""
+    index = sim.current_index
+    top = sim._max_indices[sim.current_ladder]
+    if won or index != top:
+        index += -2 if won else 1
+        sim.current_index = 0 if index < 0 else (top if index > top else index)
+        return False
+
+    # Lost at top: move to the start of the next ladder
+    sim.top_touches += 1
+    if sim.current_ladder == sim._last_ladder:
+        sim.current_index = index + 1
+        sim.stopped = True
+        sim.stop_reason = "table_limit"
+        return True
+    sim.current_ladder += 1
+    sim.current_index = 0
+    return False
+
+
+def _step_carry(sim: SessionSimulator, won: bool) -> bool:
+    """Step under carry_over_index_delta. Returns True to stop."""
+    index = sim.current_index
+    top = sim._max_indices[sim.current_ladder]
+    if won or index != top:
+        index += -2 if won else 1
+        sim.current_index = 0 if index < 0 else (top if index > top else index)
+
+        # Check for recovery completion
+        if sim.in_recovery and sim.pnl >= sim.recovery_target_pnl:
+            sim._logger.log_recovery_exit(
+                pnl=sim.pnl,
+                target=sim.recovery_target_pnl,
+            )
+            # Recovery achieved - reset to ladder 0, index 0
+            sim.in_recovery = False
+            sim.recovery_target_pnl = 0.0
+            sim.current_ladder = 0
+            sim.current_index = 0
+        return False
+
+    # Lost at top: enter or maintain recovery mode, then carry over
+    sim.top_touches += 1
+    index += 1
+    sim.current_index = index
+    if not sim.in_recovery:
+        sim.in_recovery = True
+        # Recovery target: current_pnl + (abs(current_pnl) * recovery_target_pct)
+        if sim.pnl < 0:
+            sim.recovery_target_pnl = sim.pnl + abs(sim.pnl) * sim._recovery_pct
+        else:
+            # Edge case: in profit, no recovery needed
+            sim.recovery_target_pnl = sim.pnl
+
+        sim._logger.log_recovery_enter(
+            pnl=sim.pnl,
+            target=sim.recovery_target_pnl,
+            recovery_pct=sim._recovery_pct,
+            ladder=sim.current_ladder,
+            index=index,
+        )
+
+    if sim.current_ladder == sim._last_ladder:
+        sim.stopped = True
+        sim.stop_reason = "table_limit"
+        return True
+
+    old_ladder = sim.current_ladder
+    sim.current_ladder += 1
+    # Start at crossover_offset index in next ladder
+    sim.current_index = sim._crossover_offset
+    sim._logger.log_ladder_bridge(
+        from_ladder=old_ladder,
+        from_index=index,
+        to_ladder=sim.current_ladder,
+        to_index=sim.current_index,
+        offset=sim._crossover_offset,
+        stake=sim.current_stake,
+    )
+    return False
+
+
+def _step_stop(sim: SessionSimulator, won: bool) -> bool:
+    """Step under stop_at_table_limit. Returns True to stop."""
+    index = sim.current_index
+    top = sim._max_indices[sim.current_ladder]
+    if won or index != top:
+        index += -2 if won else 1
+        sim.current_index = 0 if index < 0 else (top if index > top else index)
+        return False
+
+    # Lost at top: treat as hard stop
+    sim.top_touches += 1
+    sim.current_index = index + 1
+    sim.stopped = True
+    sim.stop_reason = "table_limit"
+    return True
+
+
+_STEP_FUNCTIONS = {
+    _PolicyId.ADVANCE: _step_advance,
+    _PolicyId.CARRY: _step_carry,
+    _PolicyId.STOP: _step_stop,
+}
+
+
+# ============================================================================
+# Vectorized Batch Engine
+# ============================================================================
+
+# Stop codes used by the batch engine (0 = still running)
+STOP_RUNNING = 0
+STOP_PROFIT_TARGET = 1
+STOP_STOP_LOSS = 2
+STOP_MAX_ROUNDS = 3
+STOP_TABLE_LIMIT = 4
+STOP_BANKROLL_EXHAUSTED = 5
+
+
+def _counter_dtype(max_rounds: int) -> np.dtype:
+    """Narrowest integer dtype for per-session counts bounded by max_rounds."""
+    return np.dtype(np.int16 if max_rounds <= np.iinfo(np.int16).max else np.int32)
+
+
+@dataclass
+class BatchSessionResults:
+    """Per-session results from the vectorized engine, one array entry per session."""
+    # Round and touch counts use the narrowest dtype that max_rounds allows
+    stop_code: np.ndarray  # int8, one of the STOP_* codes
+    final_pnl: np.ndarray
+    rounds_played: np.ndarray
+    total_wagered: np.ndarray
+    max_stake_seen: np.ndarray
+    max_drawdown: np.ndarray
+    ladder_touches: np.ndarray  # shape (n_sessions, n_ladders)
+    top_of_ladder_touches: np.ndarray
+    final_ladder: np.ndarray
+    final_index: np.ndarray
+
+    # First-passage records, shape (n_sessions, n_targets); only filled when
+    # passage targets are requested. Round 0 means the target was not reached.
+    first_passage_round: Optional[np.ndarray] = None
+    first_passage_pnl: Optional[np.ndarray] = None
+
+    @property
+    def hit_target(self) -> np.ndarray:
+        return self.stop_code == STOP_PROFIT_TARGET
+
+    @property
+    def hit_stop_loss(self) -> np.ndarray:
+        return self.stop_code == STOP_STOP_LOSS
+
+    @property
+    def hit_max_rounds(self) -> np.ndarray:
+        return self.stop_code == STOP_MAX_ROUNDS
+
+    @property
+    def hit_table_limit(self) -> np.ndarray:
+        return self.stop_code == STOP_TABLE_LIMIT
+
+    @property
+    def bankroll_exhausted(self) -> np.ndarray:
+        return self.stop_code == STOP_BANKROLL_EXHAUSTED
+
+    @classmethod
+    def concatenate(
+        cls, parts: List["BatchSessionResults"]
+    ) -> "BatchSessionResults":
+        """Join batches end to end, keeping session order."""
+        return cls(**{
+            f.name: (
+                None if getattr(parts[0], f.name) is None
+                else np.concatenate([getattr(p, f.name) for p in parts])
+            )
+            for f in fields(cls)
+        })
+
+
+def run_sessions_vectorized(
+    strategy: StrategyConfig,
+    config: SessionConfig,
+    n_sessions: int,
+    rng: np.random.Generator,
+    chunk_size: int = 256,
+    passage_targets: Optional[np.ndarray] = None,
+) -> BatchSessionResults:
+    """
+    Simulate many independent sessions in lock-step with NumPy.
+
+    Every running session advances one round per iteration. Session state
+    lives in flat arrays and the stepping, bridging and stop rules of
+    ``SessionSimulator`` are applied as masked array updates over the
+    sessions that are still running. Uniforms are drawn ``chunk_size``
+    rounds at a time for the running sessions only.
+
+    With ``n_sessions=1`` the draws line up with ``SessionSimulator`` one for
+    one, so both engines produce the same session from the same generator
+    state.
+
+    Parameters
+    ----------
+    strategy : StrategyConfig
+        Ladders and bridging policy.
+    config : SessionConfig
+        Session limits and game specification.
+    n_sessions : int
+        Number of sessions to simulate.
+    rng : np.random.Generator
+        Source of randomness.
+    chunk_size : int
+        Rounds of uniforms drawn per refill.
+    passage_targets : Optional[np.ndarray]
+        Ascending profit levels. For each one, the round and PnL at which
+        a session's PnL first reaches it are recorded in
+        ``first_passage_round`` / ``first_passage_pnl``.
+
+    Returns
+    -------
+    BatchSessionResults
+        Per-session outcome arrays.
+    """
+    # Resolve the policy to plain flags once, outside the round loop
+    stop_policy = strategy._policy_id == _PolicyId.STOP
+    carry_policy = strategy._policy_id == _PolicyId.CARRY
+    n_ladders = len(strategy.ladders)
+    stakes_flat = strategy._stakes_flat
+    ladder_offsets = strategy._ladder_offsets
+    max_index = strategy._max_index.astype(np.int64)
+    last_ladder = n_ladders - 1
+
+    bankroll = config.bankroll
+    profit_target = config.profit_target
+    stop_loss = config.stop_loss_abs
+    max_rounds = config.max_rounds
+    table_max = np.inf if config.table_max is None else config.table_max
+    p_win = config.game_spec.p_win
+    payout = config.game_spec.payout_ratio
+    recovery_pct = strategy.recovery_target_pct
+    crossover_offset = strategy.crossover_offset
+
+    # Session state (structure of arrays)
+    ladder = np.zeros(n_sessions, dtype=np.int64)
+    index = np.zeros(n_sessions, dtype=np.int64)
+    pnl = np.zeros(n_sessions)
+    rounds = np.zeros(n_sessions, dtype=np.int64)
+    total_wagered = np.zeros(n_sessions)
+    max_stake = np.zeros(n_sessions)
+    peak_pnl = np.zeros(n_sessions)
+    max_drawdown = np.zeros(n_sessions)
+    ladder_touches = np.zeros(
+        (n_sessions, n_ladders), dtype=_counter_dtype(max_rounds)
+    )
+    top_touches = np.zeros(n_sessions, dtype=np.int64)
+    in_recovery = np.zeros(n_sessions, dtype=bool)
+    recovery_target = np.zeros(n_sessions)
+    stop_code = np.zeros(n_sessions, dtype=np.int8)
+
+    first_round = first_pnl = None
+    if passage_targets is not None:
+        first_round = np.zeros(
+            (n_sessions, len(passage_targets)), dtype=_counter_dtype(max_rounds)
+        )
+        first_pnl = np.zeros((n_sessions, len(passage_targets)))
+
+    # Indices of running sessions, and their row in the current uniform chunk
+    active = np.arange(n_sessions)
+    while active.size:
+        uniforms = rng.random((active.size, chunk_size))
+        rows = np.arange(active.size)
+
+        for col in range(chunk_size):
+            if not active.size:
+                break
+
+            # Stake lookup; an offset bridge can leave index past the top,
+            # and the stake clamps to the top rung like LadderSpec.get_stake
+            lad = ladder[active]
+            stake = stakes_flat[
+                ladder_offsets[lad] + np.minimum(index[active], max_index[lad])
+            ]
+
+            # Affordability and table limit are checked before the bet
+            broke = bankroll + pnl[active] < stake
+            over = stake > table_max
+            blocked = broke | over
+            if blocked.any():
+                stop_code[active[over]] = STOP_TABLE_LIMIT
+                stop_code[active[broke]] = STOP_BANKROLL_EXHAUSTED
+                keep = ~blocked
+                active, rows, lad, stake = (
+                    active[keep], rows[keep], lad[keep], stake[keep]
+                )
+
+            # Track and resolve the bet
+            ladder_touches[active, lad] += 1
+            max_stake[active] = np.maximum(max_stake[active], stake)
+            total_wagered[active] += stake
+
+            won = uniforms[rows, col] < p_win
+            session_pnl = pnl[active] + np.where(won, stake * payout, -stake)
+            pnl[active] = session_pnl
+            session_rounds = rounds[active] + 1
+            rounds[active] = session_rounds
+
+            previous_peak = peak_pnl[active]
+            peak = np.maximum(previous_peak, session_pnl)
+            peak_pnl[active] = peak
+
+            # A new peak reaches every passage target in (previous_peak, peak]
+            if first_round is not None:
+                k_lo = np.searchsorted(passage_targets, previous_peak, side="right")
+                k_hi = np.searchsorted(passage_targets, peak, side="right")
+                counts = k_hi - k_lo
+                crossing = counts > 0
+                if crossing.any():
+                    counts = counts[crossing]
+                    sessions = np.repeat(active[crossing], counts)
+                    starts = np.repeat(np.cumsum(counts) - counts, counts)
+                    targets_hit = (
+                        np.arange(counts.sum()) - starts
+                        + np.repeat(k_lo[crossing], counts)
+                    )
+                    first_round[sessions, targets_hit] = np.repeat(
+                        session_rounds[crossing], counts
+                    )
+                    first_pnl[sessions, targets_hit] = np.repeat(
+                        session_pnl[crossing], counts
+                    )
+            max_drawdown[active] = np.maximum(
+                max_drawdown[active], peak - session_pnl
+            )
+
+            # Stop checks in SessionSimulator.play_round order
+            hit_target = session_pnl >= profit_target
+            hit_stop_loss = -session_pnl >= stop_loss
+            hit_max_rounds = session_rounds >= max_rounds
+            done = hit_target | hit_stop_loss | hit_max_rounds
+            if done.any():
+                stop_code[active[hit_max_rounds]] = STOP_MAX_ROUNDS
+                stop_code[active[hit_stop_loss]] = STOP_STOP_LOSS
+                stop_code[active[hit_target]] = STOP_PROFIT_TARGET
+                keep = ~done
+                active, rows, lad, won, session_pnl = (
+                    active[keep], rows[keep], lad[keep], won[keep],
+                    session_pnl[keep],
+                )
+
+            # Step the index: win -2, loss +1, clamp unless bridging
+            top = max_index[lad]
+            current = index[active]
+            stepped = current + np.where(won, -2, 1)
+            bridge = (current == top) & ~won
+            index[active] = np.where(bridge, stepped, np.clip(stepped, 0, top))
+
+            # Recovery completion resets to the first ladder
+            recovered = (
+                ~bridge
+                & in_recovery[active]
+                & (session_pnl >= recovery_target[active])
+            )
+            if recovered.any():
+                done_recovery = active[recovered]
+                in_recovery[done_recovery] = False
+                recovery_target[done_recovery] = 0.0
+                ladder[done_recovery] = 0
+                index[done_recovery] = 0
+
+            if not bridge.any():
+                continue
+
+            # Bridging: lost at the top of a ladder
+            bridging = active[bridge]
+            top_touches[bridging] += 1
+            at_last = lad[bridge] == last_ladder
+
+            if stop_policy:
+                halted = bridge
+            else:
+                if carry_policy:
+                    entering = bridging[~in_recovery[bridging]]
+                    entry_pnl = pnl[entering]
+                    recovery_target[entering] = np.where(
+                        entry_pnl < 0,
+                        entry_pnl + np.abs(entry_pnl) * recovery_pct,
+                        entry_pnl,
+                    )
+                    in_recovery[entering] = True
+                    start_index = crossover_offset
+                else:
+                    start_index = 0
+
+                advancing = bridging[~at_last]
+                ladder[advancing] += 1
+                index[advancing] = start_index
+                halted = bridge.copy()
+                halted[bridge] = at_last
+
+            if halted.any():
+                stop_code[active[halted]] = STOP_TABLE_LIMIT
+                keep = ~halted
+                active, rows = active[keep], rows[keep]
+
+    # State stays int64 for cheap fancy indexing; results are downcast
+    counter_dtype = _counter_dtype(max_rounds)
+    return BatchSessionResults(
+        stop_code=stop_code,
+        final_pnl=pnl,
+        rounds_played=rounds.astype(counter_dtype),
+        total_wagered=total_wagered,
+        max_stake_seen=max_stake,
+        max_drawdown=max_drawdown,
+        ladder_touches=ladder_touches,
+        top_of_ladder_touches=top_touches.astype(counter_dtype),
+        final_ladder=ladder.astype(np.int32),
+        final_index=index.astype(np.int32),
+        first_passage_round=first_round,
+        first_passage_pnl=first_pnl,
+    )
+
+
 # ============================================================================
 # Monte Carlo Engine
 # ============================================================================
@@ -472,144 +1000,308 @@ class MonteCarloResults:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary, excluding large arrays."""
-        d = asdict(self)
-        d.pop("all_pnls", None)
-        d.pop("all_rounds", None)
-        return d
+        return {
+            "n_sessions": int(self.n_sessions),
+            "prob_hit_target": float(self.prob_hit_target),
+            "prob_hit_stop_loss": float(self.prob_hit_stop_loss),
+            "prob_hit_max_rounds": float(self.prob_hit_max_rounds),
+            "prob_hit_table_limit": float(self.prob_hit_table_limit),
+            "prob_bankroll_exhausted": float(self.prob_bankroll_exhausted),
+            "mean_pnl": float(self.mean_pnl),
+            "median_pnl": float(self.median_pnl),
+            "std_pnl": float(self.std_pnl),
+            "skew_pnl": float(self.skew_pnl),
+            "kurtosis_pnl": float(self.kurtosis_pnl),
+            "pnl_95ci_lower": float(self.pnl_95ci_lower),
+            "pnl_95ci_upper": float(self.pnl_95ci_upper),
+            "mean_rounds": float(self.mean_rounds),
+            "median_rounds": float(self.median_rounds),
+            "mean_rounds_to_target": float(self.mean_rounds_to_target),
+            "median_rounds_to_target": float(self.median_rounds_to_target),
+            "mean_max_stake": float(self.mean_max_stake),
+            "median_max_stake": float(self.median_max_stake),
+            "mean_max_drawdown": float(self.mean_max_drawdown),
+            "median_max_drawdown": float(self.median_max_drawdown),
+            "prob_touch_ladder": {
+                int(k): float(v) for k, v in self.prob_touch_ladder.items()
+            },
+            "prob_top_of_ladder": float(self.prob_top_of_ladder),
+            "mean_total_wagered": float(self.mean_total_wagered),
+        }
 
 
-class MonteCarloEngine:
-    """Efficient Monte Carlo simulation engine."""
-    
-    def __init__(
-        self,
-        strategy: StrategyConfig,
-        session_config: SessionConfig,
-        n_sessions: int,
-        seed: Optional[int] = None,
-    ):
-        self.strategy = strategy
-        self.session_config = session_config
-        self.n_sessions = n_sessions
-        self.rng = np.random.default_rng(seed)
-    
-    def run(self, store_traces: bool = False) -> MonteCarloResults:
-        """Run Monte Carlo simulation."""
-        # Storage for results
-        pnls = np.zeros(self.n_sessions)
-        rounds = np.zeros(self.n_sessions, dtype=np.int32)
-        hit_target = np.zeros(self.n_sessions, dtype=bool)
-        hit_stop_loss = np.zeros(self.n_sessions, dtype=bool)
-        hit_max_rounds = np.zeros(self.n_sessions, dtype=bool)
-        hit_table_limit = np.zeros(self.n_sessions, dtype=bool)
-        bankroll_exhausted = np.zeros(self.n_sessions, dtype=bool)
-        max_stakes = np.zeros(self.n_sessions)
-        max_drawdowns = np.zeros(self.n_sessions)
-        top_touches = np.zeros(self.n_sessions, dtype=np.int32)
-        total_wagered_arr = np.zeros(self.n_sessions)
-        ladder_touches = {
-            i: np.zeros(self.n_sessions, dtype=np.int32)
-            for i in range(len(self.strategy.ladders))
-        }
-        
-        # Run sessions
-        for i in range(self.n_sessions):
-            sim = SessionSimulator(self.strategy, self.session_config, self.rng)
-            result = sim.run()
-            
-            pnls[i] = result.final_pnl
-            rounds[i] = result.rounds_played
-            hit_target[i] = result.hit_target
-            hit_stop_loss[i] = result.hit_stop_loss
-            hit_max_rounds[i] = result.hit_max_rounds
-            hit_table_limit[i] = result.hit_table_limit
-            bankroll_exhausted[i] = result.bankroll_exhausted
-            max_stakes[i] = result.max_stake_seen
-            max_drawdowns[i] = result.max_drawdown
-            top_touches[i] = result.top_of_ladder_touches
-            total_wagered_arr[i] = result.total_wagered
-            
-            for ladder_idx, count in result.ladder_touches.items():
-                ladder_touches[ladder_idx][i] = count
-        
-        # Compute metrics
-        prob_hit_target = np.mean(hit_target)
-        
+def dump_json(obj: Any, path: Path) -> None:
+    """Write obj as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(
+                obj,
+                option=(
+                    orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_SERIALIZE_NUMPY
+                ),
+            )
+        )
+        return
+    with open(path, "w") as f:
+        json.dump(obj, f, indent=2)
+
+
+def _moments(x: np.ndarray) -> Tuple[float, float, float, float]:
+    """Mean and second to fourth central moments of x, from one deviation array."""
+    mean = x.mean()
+    d = x - mean
+    d2 = d * d
+    return mean, d2.mean(), (d2 * d).mean(), (d2 * d2).mean()
+
+
+@lru_cache(maxsize=32)
+def _t_critical_975(df: int) -> float:
+    """Two-sided 95% Student t critical value, cached per degrees of freedom."""
+    return float(stats.t.ppf(0.975, df))
+
+
+def _column_medians(*columns: np.ndarray) -> np.ndarray:
+    """Medians of equal-length columns from one partition of their stack."""
+    stacked = np.stack(columns, dtype=np.float64)
+    n = stacked.shape[1]
+    mid = n // 2
+    if n % 2:
+        return np.partition(stacked, mid, axis=1)[:, mid]
+    # Even length: average the two middle values, as np.median does
+    part = np.partition(stacked, (mid - 1, mid), axis=1)
+    return (part[:, mid - 1] + part[:, mid]) / 2
+
+
+class StreamingAggregator:
+    """
+    Fold batches of session results into Monte Carlo summary metrics.
+
+    Counts, sums and PnL moments are merged batch by batch, so per-session
+    arrays only live as long as their batch. The columns that feed the
+    medians (PnL, rounds, max stake, max drawdown, rounds to target) are
+    the only per-session data kept until ``finalize``.
+    """
+
+    def __init__(self, n_ladders: int):
+        self.n = 0
+        self.stop_counts = np.zeros(STOP_BANKROLL_EXHAUSTED + 1, dtype=np.int64)
+        self.touch_counts = np.zeros(n_ladders, dtype=np.int64)
+        self.top_count = 0
+
+        # Running sums for the means
+        self.sum_rounds = 0.0
+        self.sum_max_stake = 0.0
+        self.sum_max_drawdown = 0.0
+        self.sum_wagered = 0.0
+
+        # PnL mean and summed central powers, merged pairwise (Chan/Pebay)
+        self.pnl_mean = 0.0
+        self.pnl_m2 = 0.0
+        self.pnl_m3 = 0.0
+        self.pnl_m4 = 0.0
+
+        self._pnls: List[np.ndarray] = []
+        self._rounds: List[np.ndarray] = []
+        self._max_stakes: List[np.ndarray] = []
+        self._max_drawdowns: List[np.ndarray] = []
+        self._rounds_to_target: List[np.ndarray] = []
+
+    def update(self, batch: BatchSessionResults) -> None:
+        """Fold one batch of sessions into the running totals."""
+        nb = len(batch.final_pnl)
+        if nb == 0:
+            return
+
+        self.stop_counts += np.bincount(
+            batch.stop_code, minlength=STOP_BANKROLL_EXHAUSTED + 1
+        )
+        self.touch_counts += np.count_nonzero(batch.ladder_touches, axis=0)
+        self.top_count += int(np.count_nonzero(batch.top_of_ladder_touches))
+
+        self.sum_rounds += float(np.sum(batch.rounds_played))
+        self.sum_max_stake += float(np.sum(batch.max_stake_seen))
+        self.sum_max_drawdown += float(np.sum(batch.max_drawdown))
+        self.sum_wagered += float(np.sum(batch.total_wagered))
+
+        mean_b, m2_b, m3_b, m4_b = _moments(batch.final_pnl)
+        M2_b, M3_b, M4_b = m2_b * nb, m3_b * nb, m4_b * nb
+        na = self.n
+        n = na + nb
+        delta = mean_b - self.pnl_mean
+        M2_a, M3_a, M4_a = self.pnl_m2, self.pnl_m3, self.pnl_m4
+        self.pnl_mean += delta * nb / n
+        self.pnl_m2 = M2_a + M2_b + delta**2 * na * nb / n
+        self.pnl_m3 = (
+            M3_a + M3_b
+            + delta**3 * na * nb * (na - nb) / n**2
+            + 3 * delta * (na * M2_b - nb * M2_a) / n
+        )
+        self.pnl_m4 = (
+            M4_a + M4_b
+            + delta**4 * na * nb * (na * na - na * nb + nb * nb) / n**3
+            + 6 * delta**2 * (na * na * M2_b + nb * nb * M2_a) / n**2
+            + 4 * delta * (na * M3_b - nb * M3_a) / n
+        )
+        self.n = n
+
+        self._pnls.append(batch.final_pnl)
+        self._rounds.append(batch.rounds_played)
+        self._max_stakes.append(batch.max_stake_seen)
+        self._max_drawdowns.append(batch.max_drawdown)
+        self._rounds_to_target.append(batch.rounds_played[batch.hit_target])
+
+    def finalize(self, store_traces: bool = False) -> MonteCarloResults:
+        """Summary metrics over every session folded in so far."""
+        n = self.n
+        pnls = np.concatenate(self._pnls)
+        rounds = np.concatenate(self._rounds)
+        median_pnl, median_rounds, median_max_stake, median_max_drawdown = (
+            _column_medians(
+                pnls,
+                rounds,
+                np.concatenate(self._max_stakes),
+                np.concatenate(self._max_drawdowns),
+            )
+        )
+
+        stop_probs = self.stop_counts / n
+
         # PnL metrics
-        mean_pnl = np.mean(pnls)
-        median_pnl = np.median(pnls)
-        std_pnl = np.std(pnls, ddof=1)
-        
-        # Skewness and kurtosis
-        if std_pnl > 0:
-            skew_pnl = stats.skew(pnls)
-            kurtosis_pnl = stats.kurtosis(pnls)
+        m2 = self.pnl_m2 / n
+        std_pnl = np.sqrt(self.pnl_m2 / (n - 1))
+
+        # Skewness and kurtosis (biased estimators, as scipy.stats defaults);
+        # zero for a degenerate PnL distribution
+        if m2 > 0:
+            skew_pnl = (self.pnl_m3 / n) / m2**1.5
+            kurtosis_pnl = (self.pnl_m4 / n) / m2**2 - 3.0
         else:
             skew_pnl = 0.0
             kurtosis_pnl = 0.0
-        
+
         # 95% CI for mean PnL using t-distribution
-        sem_pnl = std_pnl / np.sqrt(self.n_sessions)
-        ci_margin = stats.t.ppf(0.975, self.n_sessions - 1) * sem_pnl
-        pnl_95ci_lower = mean_pnl - ci_margin
-        pnl_95ci_upper = mean_pnl + ci_margin
-        
-        # Round metrics
-        mean_rounds = np.mean(rounds)
-        median_rounds = np.median(rounds)
-        
-        rounds_to_target = rounds[hit_target]
+        ci_margin = _t_critical_975(n - 1) * std_pnl / np.sqrt(n)
+
+        rounds_to_target = np.concatenate(self._rounds_to_target)
         if len(rounds_to_target) > 0:
             mean_rounds_to_target = np.mean(rounds_to_target)
             median_rounds_to_target = np.median(rounds_to_target)
         else:
             mean_rounds_to_target = 0.0
             median_rounds_to_target = 0.0
-        
-        # Risk metrics
-        mean_max_stake = np.mean(max_stakes)
-        median_max_stake = np.median(max_stakes)
-        mean_max_drawdown = np.mean(max_drawdowns)
-        median_max_drawdown = np.median(max_drawdowns)
-        
-        prob_touch_ladder = {
-            i: np.mean(ladder_touches[i] > 0)
-            for i in range(len(self.strategy.ladders))
-        }
-        prob_top_of_ladder = np.mean(top_touches > 0)
-        
-        mean_total_wagered = np.mean(total_wagered_arr)
-        
+
         return MonteCarloResults(
-            n_sessions=self.n_sessions,
-            prob_hit_target=float(prob_hit_target),
-            prob_hit_stop_loss=float(np.mean(hit_stop_loss)),
-            prob_hit_max_rounds=float(np.mean(hit_max_rounds)),
-            prob_hit_table_limit=float(np.mean(hit_table_limit)),
-            prob_bankroll_exhausted=float(np.mean(bankroll_exhausted)),
-            mean_pnl=float(mean_pnl),
+            n_sessions=n,
+            prob_hit_target=float(stop_probs[STOP_PROFIT_TARGET]),
+            prob_hit_stop_loss=float(stop_probs[STOP_STOP_LOSS]),
+            prob_hit_max_rounds=float(stop_probs[STOP_MAX_ROUNDS]),
+            prob_hit_table_limit=float(stop_probs[STOP_TABLE_LIMIT]),
+            prob_bankroll_exhausted=float(stop_probs[STOP_BANKROLL_EXHAUSTED]),
+            mean_pnl=float(self.pnl_mean),
             median_pnl=float(median_pnl),
             std_pnl=float(std_pnl),
             skew_pnl=float(skew_pnl),
             kurtosis_pnl=float(kurtosis_pnl),
-            pnl_95ci_lower=float(pnl_95ci_lower),
-            pnl_95ci_upper=float(pnl_95ci_upper),
-            mean_rounds=float(mean_rounds),
+            pnl_95ci_lower=float(self.pnl_mean - ci_margin),
+            pnl_95ci_upper=float(self.pnl_mean + ci_margin),
+            mean_rounds=self.sum_rounds / n,
             median_rounds=float(median_rounds),
             mean_rounds_to_target=float(mean_rounds_to_target),
             median_rounds_to_target=float(median_rounds_to_target),
-            mean_max_stake=float(mean_max_stake),
+            mean_max_stake=self.sum_max_stake / n,
             median_max_stake=float(median_max_stake),
-            mean_max_drawdown=float(mean_max_drawdown),
+            mean_max_drawdown=self.sum_max_drawdown / n,
             median_max_drawdown=float(median_max_drawdown),
-            prob_touch_ladder=prob_touch_ladder,
-            prob_top_of_ladder=float(prob_top_of_ladder),
-            mean_total_wagered=float(mean_total_wagered),
+            prob_touch_ladder=dict(enumerate((self.touch_counts / n).tolist())),
+            prob_top_of_ladder=self.top_count / n,
+            mean_total_wagered=self.sum_wagered / n,
             all_pnls=pnls if store_traces else None,
             all_rounds=rounds if store_traces else None,
         )
 
 
+def _run_chunk(
+    strategy: StrategyConfig,
+    session_config: SessionConfig,
+    n_sessions: int,
+    rng: np.random.Generator,
+) -> BatchSessionResults:
+    """Run one block of sessions in a worker process."""
+    return run_sessions_vectorized(strategy, session_config, n_sessions, rng)
+
+
+# Sessions simulated per batch when streaming into the aggregator
+_SESSION_BLOCK = 65536
+
+
+class MonteCarloEngine:
+    """
+    Efficient Monte Carlo simulation engine.
+
+    Sessions run in blocks that are folded into a ``StreamingAggregator``
+    as they finish, so only the columns needed for medians outlive their
+    block. ``n_jobs`` spreads the NumPy engine over worker processes (-1 for
+    all cores). Each block gets a child generator spawned from the engine's
+    generator, so results are reproducible for a given seed and n_jobs.
+    The Numba kernel already runs on all cores and ignores ``n_jobs``.
+    An existing generator can be passed as ``rng`` in place of ``seed``.
+    """
+    
+    def __init__(
+        self,
+        strategy: StrategyConfig,
+        session_config: SessionConfig,
+        n_sessions: int,
+        seed: Optional[int] = None,
+        n_jobs: int = 1,
+        rng: Optional[np.random.Generator] = None,
+    ):
+        self.strategy = strategy
+        self.session_config = session_config
+        self.n_sessions = n_sessions
+        self.rng = rng if rng is not None else make_rng(seed)
+        self.n_jobs = n_jobs if n_jobs > 0 else (os.cpu_count() or 1)
+
+    def _run_parallel(self) -> List[BatchSessionResults]:
+        """Split sessions into one block per worker and run them in processes."""
+        n_blocks = min(self.n_jobs, self.n_sessions)
+        base, extra = divmod(self.n_sessions, n_blocks)
+        sizes = [base + (i < extra) for i in range(n_blocks)]
+        seeds = self.rng.bit_generator.seed_seq.spawn(n_blocks)
+        children = [make_rng(seed) for seed in seeds]
+        with ProcessPoolExecutor(max_workers=n_blocks) as pool:
+            return list(pool.map(
+                _run_chunk,
+                [self.strategy] * n_blocks,
+                [self.session_config] * n_blocks,
+                sizes,
+                children,
+            ))
+
+    def _batches(self):
+        """Yield session results block by block."""
+        from simulator_numba import NUMBA_AVAILABLE, run_sessions_numba
+
+        if self.n_jobs > 1 and self.n_sessions > 1 and not NUMBA_AVAILABLE:
+            yield from self._run_parallel()
+            return
+
+        # Compiled parallel kernel when numba is installed, else lock-step NumPy
+        run_block = run_sessions_numba if NUMBA_AVAILABLE else run_sessions_vectorized
+        for start in range(0, self.n_sessions, _SESSION_BLOCK):
+            size = min(_SESSION_BLOCK, self.n_sessions - start)
+            yield run_block(self.strategy, self.session_config, size, self.rng)
+
+    def run(self, store_traces: bool = False) -> MonteCarloResults:
+        """Run Monte Carlo simulation."""
+        aggregator = StreamingAggregator(len(self.strategy.ladders))
+        for batch in self._batches():
+            aggregator.update(batch)
+        return aggregator.finalize(store_traces)
+
+
 # ============================================================================
 # Safe Target Finder
 # ============================================================================
@@ -624,7 +1316,13 @@ class SafeTargetResult:
 
 
 class SafeTargetFinder:
-    """Find the safe profit target for given risk tolerance."""
+    """
+    Find the safe profit target for given risk tolerance.
+
+    One generator is seeded at construction and shared by every run the
+    finder makes, so the metrics for the chosen target come from fresh
+    sessions rather than a replay of the grid pass.
+    """
     
     def __init__(
         self,
@@ -633,92 +1331,183 @@ class SafeTargetFinder:
         n_sessions: int = 100000,
         alpha: float = 0.01,
         seed: Optional[int] = None,
+        n_jobs: int = 1,
     ):
         self.strategy = strategy
         self.base_config = base_config
         self.n_sessions = n_sessions
         self.alpha = alpha
         self.seed = seed
+        self.n_jobs = n_jobs
+        self.rng = make_rng(seed)
     
     def search_grid(
         self, target_min: float, target_max: float, target_step: float, verbose: bool = True
     ) -> SafeTargetResult:
-        """Search over grid of profit targets."""
+        """
+        Search over grid of profit targets.
+
+        The profit target only decides when a session stops, so one batch
+        run at the largest target covers the whole grid: a session reaches
+        a smaller target T exactly when its PnL first gets to T, and
+        otherwise ends the same way it did in that run. The trade-off curve
+        and the safe target come from this single run; full metrics for the
+        safe target come from a dedicated ``MonteCarloEngine`` run.
+        """
         targets = np.arange(target_min, target_max + target_step, target_step)
+
+        # One pass at the largest target, recording first passage of every target
+        widest_config = self._config_for(targets[-1])
+        batch = run_sessions_vectorized(
+            self.strategy,
+            widest_config,
+            self.n_sessions,
+            self.rng,
+            passage_targets=targets,
+        )
+        curve = _target_curve(batch, targets)
+
         trade_off_curve = []
-        
-        safe_target = 0.0
-        safe_results = None
-        safe_ruin_prob = 1.0
-        
-        for target in targets:
-            if verbose:
-                print(f"Testing profit target: ${target:.0f}...", end=" ")
-            
-            # Create config for this target
-            config = SessionConfig(
-                bankroll=self.base_config.bankroll,
-                profit_target=target,
-                stop_loss_abs=self.base_config.stop_loss_abs,
-                max_rounds=self.base_config.max_rounds,
-                game_spec=self.base_config.game_spec,
-                table_max=self.base_config.table_max,
-                rng_seed=self.seed,
-            )
-            
-            # Run simulation
-            engine = MonteCarloEngine(
-                self.strategy, config, self.n_sessions, seed=self.seed
-            )
-            results = engine.run()
-            
-            # Ruin probability = P(hit stop loss before target)
-            ruin_prob = (
-                results.prob_hit_stop_loss
-                + results.prob_hit_table_limit
-                + results.prob_bankroll_exhausted
+        progress = []
+        for k, target in enumerate(targets):
+            ruin_prob = curve["ruin_probability"][k]
+            progress.append(
+                f"Testing profit target: ${target:.0f}... Ruin prob: {ruin_prob:.4f}"
             )
-            
-            if verbose:
-                print(f"Ruin prob: {ruin_prob:.4f}")
-            
+
             # Store in trade-off curve
             trade_off_curve.append(
                 {
                     "profit_target": float(target),
                     "ruin_probability": float(ruin_prob),
-                    "prob_hit_target": float(results.prob_hit_target),
-                    "mean_pnl": float(results.mean_pnl),
-                    "std_pnl": float(results.std_pnl),
-                    "mean_rounds": float(results.mean_rounds),
-                    "median_rounds_to_target": float(results.median_rounds_to_target),
+                    "prob_hit_target": float(curve["prob_hit_target"][k]),
+                    "mean_pnl": float(curve["mean_pnl"][k]),
+                    "std_pnl": float(curve["std_pnl"][k]),
+                    "mean_rounds": float(curve["mean_rounds"][k]),
+                    "median_rounds_to_target": float(
+                        curve["median_rounds_to_target"][k]
+                    ),
                 }
             )
-            
-            # Check if this is safe
-            if ruin_prob <= self.alpha:
-                safe_target = target
-                safe_results = results
-                safe_ruin_prob = ruin_prob
-        
-        if safe_results is None:
+
+        # The whole curve is known at once, so report it in a single write
+        if verbose:
+            print("\n".join(progress))
+
+        # Ruin can only grow with the target: a session that never reaches
+        # T never reaches a larger one either, so the curve is monotone and
+        # a binary search finds the largest safe target
+        safe_k = int(
+            np.searchsorted(curve["ruin_probability"], self.alpha, side="right")
+        ) - 1
+        if safe_k < 0:
             raise ValueError(
                 f"No safe target found in range [{target_min}, {target_max}] "
                 f"with alpha={self.alpha}"
             )
-        
+
+        safe_target = targets[safe_k]
+        engine = MonteCarloEngine(
+            self.strategy, self._config_for(safe_target), self.n_sessions,
+            n_jobs=self.n_jobs, rng=self.rng,
+        )
+
         return SafeTargetResult(
             safe_target=safe_target,
-            ruin_probability=safe_ruin_prob,
-            results=safe_results,
+            ruin_probability=float(curve["ruin_probability"][safe_k]),
+            results=engine.run(),
             trade_off_curve=trade_off_curve,
         )
 
+    def _config_for(self, target: float) -> SessionConfig:
+        """Session config for one profit target."""
+        return replace(self.base_config, profit_target=target)
+
+
+def _target_curve(
+    batch: BatchSessionResults, targets: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Per-target outcome statistics derived from first-passage records.
+
+    Parameters
+    ----------
+    batch : BatchSessionResults
+        Run at the largest target with ``passage_targets=targets``.
+    targets : np.ndarray
+        Ascending profit targets.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        One array per trade-off curve column, aligned with ``targets``.
+    """
+    reached = batch.first_passage_round > 0
+    ruined = np.isin(
+        batch.stop_code,
+        [STOP_STOP_LOSS, STOP_TABLE_LIMIT, STOP_BANKROLL_EXHAUSTED],
+    )
+
+    # Sessions that never reach T end exactly as they did in the batch run
+    pnl = np.where(reached, batch.first_passage_pnl, batch.final_pnl[:, None])
+    rounds = np.where(
+        reached, batch.first_passage_round, batch.rounds_played[:, None]
+    )
+
+    median_rounds_to_target = np.zeros(len(targets))
+    for k in range(len(targets)):
+        rounds_to_target = batch.first_passage_round[reached[:, k], k]
+        if len(rounds_to_target) > 0:
+            median_rounds_to_target[k] = np.median(rounds_to_target)
+
+    return {
+        "ruin_probability": np.mean(~reached & ruined[:, None], axis=0),
+        "prob_hit_target": np.mean(reached, axis=0),
+        "mean_pnl": np.mean(pnl, axis=0),
+        "std_pnl": np.std(pnl, axis=0, ddof=1),
+        "mean_rounds": np.mean(rounds, axis=0),
+        "median_rounds_to_target": median_rounds_to_target,
+    }
+
 
 # ============================================================================
 # Utilities
 # ============================================================================
 
+def make_rng(
+    seed: Optional[Union[int, np.random.SeedSequence]] = None,
+) -> np.random.Generator:
+    """
+    Create the generator used by the Monte Carlo engines.
+
+    PCG64DXSM is NumPy's recommended successor to the PCG64 default: the
+    same speed, with a stronger output function for the very many draws of
+    large session counts.
+    """
+    return np.random.Generator(np.random.PCG64DXSM(seed))
+
+
+def make_session_rngs(master_seed: Optional[int], n: int) -> List[np.random.Generator]:
+    """
+    Create independent, reproducible generators, one per session.
+
+    Children of a single ``SeedSequence`` have non-overlapping streams, so
+    session ``i`` draws the same numbers regardless of how many other
+    sessions run or in which order. Only needed when per-session
+    reproducibility matters; batch runs should share one generator or
+    use ``bulk_uniforms``.
+    """
+    children = np.random.SeedSequence(master_seed).spawn(n)
+    return [make_rng(child) for child in children]
+
+
+def bulk_uniforms(
+    master_seed: Optional[int], shape: Tuple[int, ...]
+) -> np.ndarray:
+    """Draw a block of float64 uniforms on [0, 1) in a single call."""
+    return make_rng(master_seed).random(shape)
+
+
 def create_default_ladders() -> List[LadderSpec]:
     """Create the default ladder configuration."""
     return [
@@ -786,94 +1575,6 @@ def print_results_summary(result: SafeTargetResult, config: SessionConfig):
     print("\n" + "=" * 80)
 
 
-# ============================================================================
-# Unit Tests
-# ============================================================================
-
-def test_step_logic():
-    """Test the basic stepping logic."""
-    print("\nRunning unit tests...")
-    
-    # Test 1: Win at index 0 stays at 0
-    ladder = LadderSpec("Test", [10, 20, 30])
-    strategy = StrategyConfig(ladders=[ladder])
-    game = GameSpec(name="test", payout_ratio=1.0, p_win=0.5)
-    config = SessionConfig(bankroll=10000, profit_target=100, stop_loss_abs=1000, game_spec=game)
-    rng = np.random.default_rng(42)
-    
-    sim = SessionSimulator(strategy, config, rng)
-    sim.current_index = 0
-    sim.step_index(won=True)  # Win
-    assert sim.current_index == 0, "Win at index 0 should stay at 0"
-    print("[PASS] Test 1: Win at index 0 stays at 0")
-
-    # Test 2: Loss moves up 1
-    sim.current_index = 0
-    sim.step_index(won=False)  # Loss
-    assert sim.current_index == 1, "Loss should move index up by 1"
-    print("[PASS] Test 2: Loss moves up 1")
-
-    # Test 3: Win moves down 2
-    sim.current_index = 2
-    sim.step_index(won=True)  # Win
-    assert sim.current_index == 0, "Win should move index down by 2"
-    print("[PASS] Test 3: Win moves down 2")
-
-    # Test 4: Win at top of ladder stays in ladder
-    sim.current_index = 2  # Max index
-    sim.step_index(won=True)  # Win
-    assert sim.current_index == 0 and sim.current_ladder == 0
-    print("[PASS] Test 4: Win at top stays in ladder")
-    
-    print("All unit tests passed!\n")
-
-
-def test_bridging_policies():
-    """Test different bridging policies."""
-    print("Testing bridging policies...")
-    
-    ladders = [
-        LadderSpec("L1", [10, 20, 30]),
-        LadderSpec("L2", [100, 200, 300]),
-    ]
-    
-    # Test advance_to_next_ladder_start
-    strategy = StrategyConfig(
-        ladders=ladders, bridging_policy="advance_to_next_ladder_start"
-    )
-    game = GameSpec(name="test", payout_ratio=1.0, p_win=0.5)
-    config = SessionConfig(bankroll=10000, profit_target=100, stop_loss_abs=1000, game_spec=game)
-    rng = np.random.default_rng(42)
-    
-    sim = SessionSimulator(strategy, config, rng)
-    sim.current_index = 2  # At top
-    should_stop = sim.step_index(won=False)  # Loss at top
-    assert not should_stop
-    assert sim.current_ladder == 1 and sim.current_index == 0
-    print("[PASS] advance_to_next_ladder_start works correctly")
-
-    # Test carry_over_index_delta
-    strategy = StrategyConfig(
-        ladders=ladders, bridging_policy="carry_over_index_delta"
-    )
-    sim = SessionSimulator(strategy, config, rng)
-    sim.current_index = 2  # At top
-    should_stop = sim.step_index(won=False)  # Loss at top
-    assert not should_stop
-    assert sim.current_ladder == 1 and sim.current_index == 0
-    print("[PASS] carry_over_index_delta works correctly")
-    
-    # Test stop_at_table_limit
-    strategy = StrategyConfig(ladders=ladders, bridging_policy="stop_at_table_limit")
-    sim = SessionSimulator(strategy, config, rng)
-    sim.current_index = 2  # At top
-    should_stop = sim.step_index(won=False)  # Loss at top
-    assert should_stop and sim.stop_reason == "table_limit"
-    print("[PASS] stop_at_table_limit works correctly")
-    
-    print("All bridging tests passed!\n")
-
-
 # ============================================================================
 # CLI
 # ============================================================================
@@ -924,11 +1625,16 @@ def main():
     parser.add_argument(
         "--max-rounds", type=int, default=5000, help="Max rounds (default: 5000)"
     )
-    parser.add_argument("--run-tests", action="store_true", help="Run unit tests")
+    parser.add_argument(
+        "--n-jobs",
+        type=int,
+        default=1,
+        help="Worker processes for the NumPy engine, -1 for all cores (default: 1)",
+    )
     parser.add_argument(
         "--config",
         type=str,
-        help="Path to .ini config file with presets",
+        help="Path to .toml or .ini config file with presets",
     )
     parser.add_argument(
         "--preset",
@@ -956,11 +1662,6 @@ def main():
 
     args = parser.parse_args()
     
-    if args.run_tests:
-        test_step_logic()
-        test_bridging_policies()
-        return
-
     # Configure logging
     configure_simulator_logging(level=args.log_level)
 
@@ -1027,6 +1728,7 @@ def main():
         n_sessions=args.n_sessions,
         alpha=args.alpha,
         seed=args.seed,
+        n_jobs=args.n_jobs,
     )
     
     result = finder.search_grid(
@@ -1063,8 +1765,7 @@ def main():
     }
 
     json_path = output_dir / f"simulation_results_{timestamp}.json"
-    with open(json_path, "w") as f:
-        json.dump(json_output, f, indent=2)
+    dump_json(json_output, json_path)
     print(f"\nResults saved to: {json_path}")
 
     # Save trade-off curve as CSV
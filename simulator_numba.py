@@ -0,0 +1,421 @@
+"""
+Numba-compiled session kernels for the betting simulator.
+
+Numba is an optional accelerator. When it is installed, the per-round
+state machine of ``SessionSimulator`` is compiled to machine code and the
+Monte Carlo driver runs sessions in parallel across cores. When it is not,
+``NUMBA_AVAILABLE`` is False and callers fall back to the NumPy engine in
+``simulator.run_sessions_vectorized``.
+
+The kernels are compiled once per bridging policy (``POLICY_FNS``), so
+the per-round loop carries no policy branch.
+
+Each session reseeds Numba's Mersenne Twister from its own seed before
+drawing, so results do not depend on thread scheduling. With the same
+seed, a session matches ``SessionSimulator`` driven by
+the legacy-seeded MT19937 stream, draw for draw.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from simulator import (
+    BatchSessionResults,
+    SessionConfig,
+    StrategyConfig,
+    STOP_BANKROLL_EXHAUSTED,
+    STOP_MAX_ROUNDS,
+    STOP_PROFIT_TARGET,
+    STOP_STOP_LOSS,
+    STOP_TABLE_LIMIT,
+    POLICY_DISPATCH,
+    _PolicyId,
+    _counter_dtype,
+)
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Identity decorator used when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+
+# Plain ints so the compiled kernels see compile-time constants
+_ADVANCE = int(_PolicyId.ADVANCE)
+_CARRY = int(_PolicyId.CARRY)
+_TARGET = STOP_PROFIT_TARGET
+_STOP_LOSS = STOP_STOP_LOSS
+_MAX_ROUNDS = STOP_MAX_ROUNDS
+_TABLE_LIMIT = STOP_TABLE_LIMIT
+_BANKROLL = STOP_BANKROLL_EXHAUSTED
+
+# Column layout of the per-session output rows written by the parallel kernel
+_COL_STOP = 0
+_COL_PNL = 1
+_COL_ROUNDS = 2
+_COL_WAGERED = 3
+_COL_MAX_STAKE = 4
+_COL_DRAWDOWN = 5
+_COL_TOP_TOUCHES = 6
+_COL_LADDER = 7
+_COL_INDEX = 8
+_N_COLS = 9
+
+
+def _flat_ladders(
+    strategy: StrategyConfig,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The strategy's (stakes_flat, ladder_offsets, ladder_lens) arrays."""
+    return strategy._stakes_flat, strategy._ladder_offsets, strategy._ladder_lens
+
+
+@njit(cache=True, inline="always")
+def _step_core(
+    ladder: int,
+    index: int,
+    pnl: float,
+    won: bool,
+    policy_id: int,
+    in_recovery: bool,
+    recovery_target: float,
+    ladder_lens: np.ndarray,
+    recovery_pct: float,
+    crossover_offset: int,
+) -> Tuple[int, int, bool, float, int, bool]:
+    """
+    Step the ladder position after one resolved bet.
+
+    The compiled counterpart of ``SessionSimulator.step_index``: win -2,
+    loss +1, clamped to the ladder, and bridging per policy on a loss at
+    the top. Inlined into the session kernels, so a constant ``policy_id``
+    folds the policy branch away.
+
+    Parameters
+    ----------
+    ladder, index : int
+        Position before the step.
+    pnl : float
+        Session PnL after the bet.
+    won : bool
+        Outcome of the bet.
+    policy_id : int
+        Bridging policy, as a ``_PolicyId`` value.
+    in_recovery : bool
+        Whether recovery mode is active.
+    recovery_target : float
+        PnL that ends recovery mode.
+    ladder_lens : np.ndarray
+        Number of stakes in each ladder.
+    recovery_pct : float
+        Fraction of the loss to recover before resetting to ladder 0.
+    crossover_offset : int
+        Start index in the next ladder under ``carry_over_index_delta``.
+
+    Returns
+    -------
+    tuple
+        (ladder, index, in_recovery, recovery_target, stop_code, bridged),
+        where ``stop_code`` is 0 or ``STOP_TABLE_LIMIT`` and ``bridged``
+        marks a loss at the top of a ladder.
+    """
+    top = ladder_lens[ladder] - 1
+    if won or index != top:
+        # Straight-line step and clamp; compiles to min/max, not branches
+        index = min(max(index + 1 - 3 * won, 0), top)
+        if in_recovery and pnl >= recovery_target:
+            # Recovery achieved: reset to the start of the first ladder
+            return 0, 0, False, 0.0, 0, False
+        return ladder, index, in_recovery, recovery_target, 0, False
+
+    # Lost at the top of the ladder: bridge
+    index += 1
+    last_ladder = ladder_lens.shape[0] - 1
+    if policy_id == _ADVANCE:
+        if ladder == last_ladder:
+            return ladder, index, in_recovery, recovery_target, _TABLE_LIMIT, True
+        return ladder + 1, 0, in_recovery, recovery_target, 0, True
+    if policy_id == _CARRY:
+        if not in_recovery:
+            in_recovery = True
+            # pnl + |pnl| * pct on a loss, pnl otherwise, without a branch
+            recovery_target = pnl - min(pnl, 0.0) * recovery_pct
+        if ladder == last_ladder:
+            return ladder, index, in_recovery, recovery_target, _TABLE_LIMIT, True
+        return ladder + 1, crossover_offset, in_recovery, recovery_target, 0, True
+    return ladder, index, in_recovery, recovery_target, _TABLE_LIMIT, True
+
+
+def _make_kernels(policy_id: int):
+    """
+    Compile the session kernel and parallel driver for one bridging policy.
+
+    ``policy_id`` is a closure constant, so Numba folds the policy branch at
+    compile time and each policy gets a loop without it.
+    """
+
+    @njit(cache=True)
+    def simulate_session(
+        stakes_flat: np.ndarray,
+        ladder_offsets: np.ndarray,
+        ladder_lens: np.ndarray,
+        p_win: float,
+        payout_ratio: float,
+        bankroll: float,
+        profit_target: float,
+        stop_loss_abs: float,
+        max_rounds: int,
+        table_max: float,
+        crossover_offset: int,
+        recovery_pct: float,
+        seed: int,
+        ladder_touches: np.ndarray,
+    ) -> Tuple[int, float, int, float, float, float, int, int, int]:
+        """
+        Simulate one session and return its outcome as a flat tuple.
+
+        Parameters
+        ----------
+        stakes_flat : np.ndarray
+            Stakes of every ladder laid end to end.
+        ladder_offsets : np.ndarray
+            Position of each ladder's first stake in ``stakes_flat``.
+        ladder_lens : np.ndarray
+            Number of stakes in each ladder.
+        p_win, payout_ratio : float
+            Game specification.
+        bankroll, profit_target, stop_loss_abs : float
+            Session limits.
+        max_rounds : int
+            Round cap.
+        table_max : float
+            Largest allowed stake; ``np.inf`` when there is no table limit.
+        crossover_offset : int
+            Start index in the next ladder under ``carry_over_index_delta``.
+        recovery_pct : float
+            Fraction of the loss to recover before resetting to ladder 0.
+        seed : int
+            Seed for this session's draws.
+        ladder_touches : np.ndarray
+            Output row, incremented once per round at the current ladder.
+
+        Returns
+        -------
+        tuple
+            (stop_code, final_pnl, rounds, total_wagered, max_stake,
+            max_drawdown, top_touches, final_ladder, final_index)
+        """
+        np.random.seed(seed)
+
+        ladder = 0
+        index = 0
+        pnl = 0.0
+        rounds = 0
+        total_wagered = 0.0
+        max_stake = 0.0
+        max_drawdown = 0.0
+        peak_pnl = 0.0
+        top_touches = 0
+        in_recovery = False
+        recovery_target = 0.0
+        stop_code = 0
+
+        while stop_code == 0:
+            top = ladder_lens[ladder] - 1
+            clamped = 0 if index < 0 else (top if index > top else index)
+            stake = stakes_flat[ladder_offsets[ladder] + clamped]
+
+            if bankroll + pnl < stake:
+                stop_code = _BANKROLL
+                break
+            if stake > table_max:
+                stop_code = _TABLE_LIMIT
+                break
+
+            ladder_touches[ladder] += 1
+            max_stake = max(max_stake, stake)
+            total_wagered += stake
+
+            won = np.random.random() < p_win
+            pnl += stake * payout_ratio if won else -stake
+            rounds += 1
+
+            peak_pnl = max(peak_pnl, pnl)
+            max_drawdown = max(max_drawdown, peak_pnl - pnl)
+
+            if pnl >= profit_target:
+                stop_code = _TARGET
+            elif -pnl >= stop_loss_abs:
+                stop_code = _STOP_LOSS
+            elif rounds >= max_rounds:
+                stop_code = _MAX_ROUNDS
+            else:
+                (
+                    ladder,
+                    index,
+                    in_recovery,
+                    recovery_target,
+                    stop_code,
+                    bridged,
+                ) = _step_core(
+                    ladder,
+                    index,
+                    pnl,
+                    won,
+                    policy_id,
+                    in_recovery,
+                    recovery_target,
+                    ladder_lens,
+                    recovery_pct,
+                    crossover_offset,
+                )
+                if bridged:
+                    top_touches += 1
+
+        return (
+            stop_code,
+            pnl,
+            rounds,
+            total_wagered,
+            max_stake,
+            max_drawdown,
+            top_touches,
+            ladder,
+            index,
+        )
+
+    @njit(cache=True, parallel=True)
+    def run_sessions(
+        stakes_flat: np.ndarray,
+        ladder_offsets: np.ndarray,
+        ladder_lens: np.ndarray,
+        p_win: float,
+        payout_ratio: float,
+        bankroll: float,
+        profit_target: float,
+        stop_loss_abs: float,
+        max_rounds: int,
+        table_max: float,
+        crossover_offset: int,
+        recovery_pct: float,
+        seeds: np.ndarray,
+        out: np.ndarray,
+        ladder_touches: np.ndarray,
+    ) -> None:
+        """Run every session across cores, one output row per session."""
+        for i in prange(seeds.shape[0]):
+            result = simulate_session(
+                stakes_flat,
+                ladder_offsets,
+                ladder_lens,
+                p_win,
+                payout_ratio,
+                bankroll,
+                profit_target,
+                stop_loss_abs,
+                max_rounds,
+                table_max,
+                crossover_offset,
+                recovery_pct,
+                seeds[i],
+                ladder_touches[i],
+            )
+            row = out[i]
+            row[_COL_STOP] = result[0]
+            row[_COL_PNL] = result[1]
+            row[_COL_ROUNDS] = result[2]
+            row[_COL_WAGERED] = result[3]
+            row[_COL_MAX_STAKE] = result[4]
+            row[_COL_DRAWDOWN] = result[5]
+            row[_COL_TOP_TOUCHES] = result[6]
+            row[_COL_LADDER] = result[7]
+            row[_COL_INDEX] = result[8]
+
+    return simulate_session, run_sessions
+
+
+_KERNELS = {
+    name: _make_kernels(int(policy_id))
+    for name, policy_id in POLICY_DISPATCH.items()
+}
+
+# Session kernel per bridging policy, and the matching parallel drivers
+POLICY_FNS = {name: kernels[0] for name, kernels in _KERNELS.items()}
+_POLICY_DRIVERS = {name: kernels[1] for name, kernels in _KERNELS.items()}
+
+
+def run_sessions_numba(
+    strategy: StrategyConfig,
+    config: SessionConfig,
+    n_sessions: int,
+    rng: np.random.Generator,
+) -> BatchSessionResults:
+    """
+    Simulate many independent sessions with the compiled kernel.
+
+    Parameters
+    ----------
+    strategy : StrategyConfig
+        Ladders and bridging policy.
+    config : SessionConfig
+        Session limits and game specification.
+    n_sessions : int
+        Number of sessions to simulate.
+    rng : np.random.Generator
+        Source of the per-session seeds.
+
+    Returns
+    -------
+    BatchSessionResults
+        Per-session outcome arrays, in the same layout as
+        ``run_sessions_vectorized``.
+    """
+    seeds = rng.integers(0, 2**32, size=n_sessions, dtype=np.uint32)
+    out = np.empty((n_sessions, _N_COLS))
+    counter_dtype = _counter_dtype(config.max_rounds)
+    ladder_touches = np.zeros(
+        (n_sessions, len(strategy.ladders)), dtype=counter_dtype
+    )
+    table_max = np.inf if config.table_max is None else config.table_max
+
+    stakes_flat, ladder_offsets, ladder_lens = _flat_ladders(strategy)
+    _POLICY_DRIVERS[strategy.bridging_policy](
+        stakes_flat,
+        ladder_offsets,
+        ladder_lens,
+        config.game_spec.p_win,
+        config.game_spec.payout_ratio,
+        config.bankroll,
+        config.profit_target,
+        config.stop_loss_abs,
+        config.max_rounds,
+        table_max,
+        strategy.crossover_offset,
+        strategy.recovery_target_pct,
+        seeds.astype(np.int64),
+        out,
+        ladder_touches,
+    )
+
+    # Integer columns are exact in float64; split the rows into typed columns
+    return BatchSessionResults(
+        stop_code=out[:, _COL_STOP].astype(np.int8),
+        final_pnl=out[:, _COL_PNL].copy(),
+        rounds_played=out[:, _COL_ROUNDS].astype(counter_dtype),
+        total_wagered=out[:, _COL_WAGERED].copy(),
+        max_stake_seen=out[:, _COL_MAX_STAKE].copy(),
+        max_drawdown=out[:, _COL_DRAWDOWN].copy(),
+        ladder_touches=ladder_touches,
+        top_of_ladder_touches=out[:, _COL_TOP_TOUCHES].astype(counter_dtype),
+        final_ladder=out[:, _COL_LADDER].astype(np.int32),
+        final_index=out[:, _COL_INDEX].astype(np.int32),
+    )
@@ -6,12 +6,8 @@ Provides reusable test components following NumPy-style documentation.
 
 import pytest
 import numpy as np
-from typing import List
-
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from functools import lru_cache
+from typing import Callable, Tuple
 
 from simulator import (
     GameSpec,
@@ -23,7 +19,23 @@ from simulator import (
 )
 
 
-@pytest.fixture
+# Stakes of the shared test ladders L1, L2, L3
+LADDER_STAKES = (
+    (10.0, 20.0, 30.0),
+    (100.0, 200.0, 300.0),
+    (1000.0, 2000.0, 3000.0),
+)
+
+
+def _make_ladders(n_ladders: int) -> Tuple[LadderSpec, ...]:
+    """First ``n_ladders`` of the shared test ladders."""
+    return tuple(
+        LadderSpec(f"L{i + 1}", stakes)
+        for i, stakes in enumerate(LADDER_STAKES[:n_ladders])
+    )
+
+
+@pytest.fixture(scope="session")
 def even_money_game() -> GameSpec:
     """
     Standard even-money game specification.
@@ -36,47 +48,40 @@ def even_money_game() -> GameSpec:
     return GameSpec(name="even_money", payout_ratio=1.0, p_win=0.495)
 
 
-@pytest.fixture
-def basic_ladders() -> List[LadderSpec]:
+@pytest.fixture(scope="session")
+def basic_ladders() -> Tuple[LadderSpec, ...]:
     """
     Simple two-ladder setup for testing.
 
     Returns
     -------
-    List[LadderSpec]
+    Tuple[LadderSpec, ...]
         L1 with stakes [10, 20, 30], L2 with stakes [100, 200, 300].
     """
-    return [
-        LadderSpec("L1", [10.0, 20.0, 30.0]),
-        LadderSpec("L2", [100.0, 200.0, 300.0]),
-    ]
+    return _make_ladders(2)
 
 
-@pytest.fixture
-def three_ladder_setup() -> List[LadderSpec]:
+@pytest.fixture(scope="session")
+def three_ladder_setup() -> Tuple[LadderSpec, ...]:
     """
     Three-ladder setup for edge case testing.
 
     Returns
     -------
-    List[LadderSpec]
+    Tuple[LadderSpec, ...]
         Three ladders with increasing stake ranges.
     """
-    return [
-        LadderSpec("L1", [10.0, 20.0, 30.0]),
-        LadderSpec("L2", [100.0, 200.0, 300.0]),
-        LadderSpec("L3", [1000.0, 2000.0, 3000.0]),
-    ]
+    return _make_ladders(3)
 
 
-@pytest.fixture
-def recovery_strategy(basic_ladders: List[LadderSpec]) -> StrategyConfig:
+@pytest.fixture(scope="session")
+def recovery_strategy(basic_ladders: Tuple[LadderSpec, ...]) -> StrategyConfig:
     """
     Strategy configured for carry_over_index_delta policy.
 
     Parameters
     ----------
-    basic_ladders : List[LadderSpec]
+    basic_ladders : Tuple[LadderSpec, ...]
         Ladder configuration from fixture.
 
     Returns
@@ -92,14 +97,14 @@ def recovery_strategy(basic_ladders: List[LadderSpec]) -> StrategyConfig:
     )
 
 
-@pytest.fixture
-def advance_strategy(basic_ladders: List[LadderSpec]) -> StrategyConfig:
+@pytest.fixture(scope="session")
+def advance_strategy(basic_ladders: Tuple[LadderSpec, ...]) -> StrategyConfig:
     """
     Strategy configured for advance_to_next_ladder_start policy.
 
     Parameters
     ----------
-    basic_ladders : List[LadderSpec]
+    basic_ladders : Tuple[LadderSpec, ...]
         Ladder configuration from fixture.
 
     Returns
@@ -113,28 +118,7 @@ def advance_strategy(basic_ladders: List[LadderSpec]) -> StrategyConfig:
     )
 
 
-@pytest.fixture
-def stop_strategy(basic_ladders: List[LadderSpec]) -> StrategyConfig:
-    """
-    Strategy configured for stop_at_table_limit policy.
-
-    Parameters
-    ----------
-    basic_ladders : List[LadderSpec]
-        Ladder configuration from fixture.
-
-    Returns
-    -------
-    StrategyConfig
-        Strategy that stops at table limit.
-    """
-    return StrategyConfig(
-        ladders=basic_ladders,
-        bridging_policy="stop_at_table_limit",
-    )
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def basic_session_config(even_money_game: GameSpec) -> SessionConfig:
     """
     Standard session configuration for testing.
@@ -158,40 +142,87 @@ def basic_session_config(even_money_game: GameSpec) -> SessionConfig:
     )
 
 
-@pytest.fixture
-def seeded_rng() -> np.random.Generator:
+@pytest.fixture(scope="module")
+def rng_pool() -> Callable[[int], np.random.Generator]:
+    """
+    Seeded generators shared by every test in a module.
+
+    Each seed is constructed once; later requests rewind the same generator
+    to its freshly seeded state instead of allocating a new one.
+
+    Returns
+    -------
+    Callable[[int], np.random.Generator]
+        ``rng(seed)``, equivalent to ``np.random.default_rng(seed)``.
+    """
+    generators = {}
+    seeded_states = {}
+
+    def rng(seed: int) -> np.random.Generator:
+        generator = generators.get(seed)
+        if generator is None:
+            generator = generators[seed] = np.random.default_rng(seed)
+            seeded_states[seed] = generator.bit_generator.state
+        else:
+            generator.bit_generator.state = seeded_states[seed]
+        return generator
+
+    return rng
+
+
+@pytest.fixture(scope="session")
+def null_rng() -> np.random.Generator:
     """
-    Deterministic RNG for reproducible tests.
+    Shared RNG for tests that never draw from it.
+
+    For tests that drive ``step_index(won=...)`` directly; its state is
+    not reset between tests.
 
     Returns
     -------
     np.random.Generator
-        Generator seeded with 42.
+        Generator seeded with 0.
     """
-    return np.random.default_rng(42)
+    return np.random.default_rng(0)
 
 
-@pytest.fixture
-def recovery_simulator(
-    recovery_strategy: StrategyConfig,
+@pytest.fixture(scope="module")
+def simulator_factory(
     basic_session_config: SessionConfig,
-    seeded_rng: np.random.Generator,
-) -> SessionSimulator:
+) -> Callable[..., SessionSimulator]:
     """
-    Pre-configured simulator with recovery policy.
+    Memoized simulator factory shared by every test in a module.
+
+    Each distinct (policy, recovery_pct, offset, n_ladders) builds one
+    simulator on the shared ladders and the standard session config; later
+    requests return the same instance. Tests must call
+    ``SessionSimulator.reset_state`` before use.
 
     Parameters
     ----------
-    recovery_strategy : StrategyConfig
-        Strategy with carry_over_index_delta policy.
     basic_session_config : SessionConfig
-        Standard session configuration.
-    seeded_rng : np.random.Generator
-        Deterministic RNG.
+        Session configuration from fixture.
 
     Returns
     -------
-    SessionSimulator
-        Ready-to-use simulator instance.
-    """
-    return SessionSimulator(recovery_strategy, basic_session_config, seeded_rng)
+    Callable[..., SessionSimulator]
+        ``factory(policy, recovery_pct=0.5, offset=1, n_ladders=2)``.
+    """
+    @lru_cache(maxsize=None)
+    def factory(
+        policy: BridgingPolicy,
+        recovery_pct: float = 0.5,
+        offset: int = 1,
+        n_ladders: int = 2,
+    ) -> SessionSimulator:
+        strategy = StrategyConfig(
+            ladders=_make_ladders(n_ladders),
+            bridging_policy=policy,
+            recovery_target_pct=recovery_pct,
+            crossover_offset=offset,
+        )
+        return SessionSimulator(
+            strategy, basic_session_config, np.random.default_rng(42)
+        )
+
+    return factory
@@ -7,12 +7,7 @@ and compares outcomes.
 
 import pytest
 import numpy as np
-from typing import List
-
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from typing import Callable, Tuple
 
 from simulator import (
     GameSpec,
@@ -28,16 +23,16 @@ class TestAdvanceToNextLadderStart:
 
     def test_advances_to_index_zero(
         self,
-        basic_ladders: List[LadderSpec],
+        basic_ladders: Tuple[LadderSpec, ...],
         basic_session_config: SessionConfig,
-        seeded_rng: np.random.Generator,
+        null_rng: np.random.Generator,
     ) -> None:
         """Bridging advances to index 0 of next ladder."""
         strategy = StrategyConfig(
             ladders=basic_ladders,
             bridging_policy="advance_to_next_ladder_start",
         )
-        sim = SessionSimulator(strategy, basic_session_config, seeded_rng)
+        sim = SessionSimulator(strategy, basic_session_config, null_rng)
 
         sim.current_ladder = 0
         sim.current_index = 2  # Top of L1
@@ -48,16 +43,16 @@ class TestAdvanceToNextLadderStart:
 
     def test_no_recovery_mode(
         self,
-        basic_ladders: List[LadderSpec],
+        basic_ladders: Tuple[LadderSpec, ...],
         basic_session_config: SessionConfig,
-        seeded_rng: np.random.Generator,
+        null_rng: np.random.Generator,
     ) -> None:
         """advance_to_next_ladder_start does not enter recovery mode."""
         strategy = StrategyConfig(
             ladders=basic_ladders,
             bridging_policy="advance_to_next_ladder_start",
         )
-        sim = SessionSimulator(strategy, basic_session_config, seeded_rng)
+        sim = SessionSimulator(strategy, basic_session_config, null_rng)
 
         sim.current_ladder = 0
         sim.current_index = 2
@@ -71,104 +66,57 @@ class TestStopAtTableLimit:
     """Tests for stop_at_table_limit policy."""
 
     def test_stops_session(
-        self,
-        basic_ladders: List[LadderSpec],
-        basic_session_config: SessionConfig,
-        seeded_rng: np.random.Generator,
+        self, simulator_factory: Callable[..., SessionSimulator]
     ) -> None:
-        """Loss at top of ladder stops the session."""
-        strategy = StrategyConfig(
-            ladders=basic_ladders,
-            bridging_policy="stop_at_table_limit",
-        )
-        sim = SessionSimulator(strategy, basic_session_config, seeded_rng)
+        """Loss at first ladder top stops the session without advancing."""
+        sim = simulator_factory("stop_at_table_limit")
+        sim.reset_state(ladder=0, index=2)  # Top
 
-        sim.current_ladder = 0
-        sim.current_index = 2  # Top
         stopped = sim.step_index(won=False)
 
         assert stopped is True
         assert sim.stopped is True
         assert sim.stop_reason == "table_limit"
+        assert sim.current_ladder == 0  # Never advanced
 
-    def test_stop_at_first_ladder_top(
-        self,
-        basic_ladders: List[LadderSpec],
-        basic_session_config: SessionConfig,
-        seeded_rng: np.random.Generator,
-    ) -> None:
-        """Stops at first ladder top, never reaches second."""
-        strategy = StrategyConfig(
-            ladders=basic_ladders,
-            bridging_policy="stop_at_table_limit",
-        )
-        sim = SessionSimulator(strategy, basic_session_config, seeded_rng)
-
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.step_index(won=False)
 
-        assert sim.current_ladder == 0  # Never advanced
+ALL_POLICIES = [
+    "advance_to_next_ladder_start",
+    "carry_over_index_delta",
+    "stop_at_table_limit",
+]
 
 
 class TestPolicyComparison:
     """Compare behavior across all policies."""
 
+    @pytest.mark.parametrize("policy", ALL_POLICIES)
     def test_win_behavior_same_across_policies(
-        self,
-        basic_ladders: List[LadderSpec],
-        basic_session_config: SessionConfig,
+        self, simulator_factory: Callable[..., SessionSimulator], policy: str
     ) -> None:
         """Win at top of ladder behaves the same for all policies."""
-        policies = [
-            "advance_to_next_ladder_start",
-            "carry_over_index_delta",
-            "stop_at_table_limit",
-        ]
-
-        for policy in policies:
-            rng = np.random.default_rng(42)
-            strategy = StrategyConfig(
-                ladders=basic_ladders,
-                bridging_policy=policy,
-            )
-            sim = SessionSimulator(strategy, basic_session_config, rng)
-
-            sim.current_ladder = 0
-            sim.current_index = 2
-            stopped = sim.step_index(won=True)
-
-            assert stopped is False, f"{policy} should not stop on win"
-            assert sim.current_ladder == 0, f"{policy} should stay in ladder"
-            assert sim.current_index == 0, f"{policy} should move down"
+        sim = simulator_factory(policy)
+        sim.reset_state(ladder=0, index=2)
 
+        stopped = sim.step_index(won=True)
+
+        assert stopped is False
+        assert sim.current_ladder == 0  # Stays in ladder
+        assert sim.current_index == 0  # Moves down
+
+    @pytest.mark.parametrize("policy", ALL_POLICIES)
     def test_loss_not_at_top_same_across_policies(
-        self,
-        basic_ladders: List[LadderSpec],
-        basic_session_config: SessionConfig,
+        self, simulator_factory: Callable[..., SessionSimulator], policy: str
     ) -> None:
         """Loss not at top behaves the same for all policies."""
-        policies = [
-            "advance_to_next_ladder_start",
-            "carry_over_index_delta",
-            "stop_at_table_limit",
-        ]
+        sim = simulator_factory(policy)
+        sim.reset_state(ladder=0, index=1)  # Not at top
 
-        for policy in policies:
-            rng = np.random.default_rng(42)
-            strategy = StrategyConfig(
-                ladders=basic_ladders,
-                bridging_policy=policy,
-            )
-            sim = SessionSimulator(strategy, basic_session_config, rng)
-
-            sim.current_ladder = 0
-            sim.current_index = 1  # Not at top
-            stopped = sim.step_index(won=False)
+        stopped = sim.step_index(won=False)
 
-            assert stopped is False, f"{policy} should not stop"
-            assert sim.current_ladder == 0, f"{policy} should stay in ladder"
-            assert sim.current_index == 2, f"{policy} should move up"
+        assert stopped is False
+        assert sim.current_ladder == 0  # Stays in ladder
+        assert sim.current_index == 2  # Moves up
 
 
 class TestFullSessionWithRecovery:
@@ -178,6 +126,7 @@ class TestFullSessionWithRecovery:
         self,
         recovery_strategy: StrategyConfig,
         even_money_game: GameSpec,
+        rng_pool: Callable[[int], np.random.Generator],
     ) -> None:
         """Full session with recovery mode reaches conclusion."""
         config = SessionConfig(
@@ -187,23 +136,18 @@ class TestFullSessionWithRecovery:
             game_spec=even_money_game,
             max_rounds=1000,
         )
-        rng = np.random.default_rng(42)
-        sim = SessionSimulator(recovery_strategy, config, rng)
+        sim = SessionSimulator(recovery_strategy, config, rng_pool(42))
 
-        # Run session
-        rounds = 0
-        while rounds < config.max_rounds:
-            if not sim.play_round():
-                break
-            rounds += 1
+        pnl, rounds, stopped = sim.run_until_stopped(config.max_rounds)
 
         # Session should have completed somehow
-        assert sim.stopped or sim.pnl >= config.profit_target or rounds == config.max_rounds
+        assert stopped or pnl >= config.profit_target or rounds == config.max_rounds
 
     def test_recovery_can_occur_multiple_times(
         self,
-        three_ladder_setup: List[LadderSpec],
+        three_ladder_setup: Tuple[LadderSpec, ...],
         even_money_game: GameSpec,
+        rng_pool: Callable[[int], np.random.Generator],
     ) -> None:
         """Recovery mode can be entered and exited multiple times."""
         strategy = StrategyConfig(
@@ -219,20 +163,21 @@ class TestFullSessionWithRecovery:
             game_spec=even_money_game,
             max_rounds=2000,
         )
-        rng = np.random.default_rng(123)  # Seed that produces recovery events
-        sim = SessionSimulator(strategy, config, rng)
+        # Seed that produces recovery events
+        sim = SessionSimulator(strategy, config, rng_pool(123))
 
         recovery_entries = 0
         was_in_recovery = False
 
+        play = sim.play_round
         for _ in range(config.max_rounds):
-            if not sim.play_round():
+            if not play():
                 break
 
             # Track recovery mode transitions
-            if sim.in_recovery and not was_in_recovery:
-                recovery_entries += 1
-            was_in_recovery = sim.in_recovery
+            in_recovery = sim.in_recovery
+            recovery_entries += in_recovery and not was_in_recovery
+            was_in_recovery = in_recovery
 
         # May or may not have recovery entries depending on RNG
         # This test just ensures it doesn't crash
@@ -0,0 +1,161 @@
+"""
+Core stepping and bridging tests for SessionSimulator.
+
+Covers the index stepping rules (win -2, loss +1, clamped to the ladder)
+and the immediate effect of each bridging policy on a loss at the top.
+"""
+
+import pytest
+import numpy as np
+from typing import Tuple
+
+from simulator import (
+    LadderSpec,
+    StrategyConfig,
+    SessionConfig,
+    SessionSimulator,
+    make_rng,
+)
+
+
+class TestStepLogic:
+    """Tests for the basic index stepping rules."""
+
+    @pytest.fixture
+    def simulator(
+        self,
+        basic_session_config: SessionConfig,
+        null_rng: np.random.Generator,
+    ) -> SessionSimulator:
+        """Simulator on a single three-rung ladder."""
+        strategy = StrategyConfig(ladders=[LadderSpec("Test", [10, 20, 30])])
+        return SessionSimulator(strategy, basic_session_config, null_rng)
+
+    def test_win_at_index_zero_stays(self, simulator: SessionSimulator) -> None:
+        """Win at index 0 stays at 0."""
+        simulator.current_index = 0
+        simulator.step_index(won=True)
+        assert simulator.current_index == 0
+
+    def test_loss_moves_up_one(self, simulator: SessionSimulator) -> None:
+        """Loss moves the index up by 1."""
+        simulator.current_index = 0
+        simulator.step_index(won=False)
+        assert simulator.current_index == 1
+
+    def test_win_moves_down_two(self, simulator: SessionSimulator) -> None:
+        """Win moves the index down by 2."""
+        simulator.current_index = 2
+        simulator.step_index(won=True)
+        assert simulator.current_index == 0
+
+    def test_win_at_top_stays_in_ladder(
+        self, simulator: SessionSimulator
+    ) -> None:
+        """Win at the top of the ladder does not bridge."""
+        simulator.current_index = 2
+        simulator.step_index(won=True)
+        assert simulator.current_index == 0
+        assert simulator.current_ladder == 0
+
+
+class TestBridgingOnLossAtTop:
+    """Immediate effect of each bridging policy on a loss at the top."""
+
+    def _bridge(
+        self,
+        ladders: Tuple[LadderSpec, ...],
+        policy: str,
+        config: SessionConfig,
+        rng: np.random.Generator,
+    ):
+        """Lose at the top of the first ladder; return (simulator, stop)."""
+        strategy = StrategyConfig(ladders=ladders, bridging_policy=policy)
+        sim = SessionSimulator(strategy, config, rng)
+        sim.current_index = 2
+        return sim, sim.step_index(won=False)
+
+    def test_advance_to_next_ladder_start(
+        self,
+        basic_ladders: Tuple[LadderSpec, ...],
+        basic_session_config: SessionConfig,
+        null_rng: np.random.Generator,
+    ) -> None:
+        """advance_to_next_ladder_start moves to index 0 of the next ladder."""
+        sim, should_stop = self._bridge(
+            basic_ladders, "advance_to_next_ladder_start",
+            basic_session_config, null_rng,
+        )
+        assert not should_stop
+        assert sim.current_ladder == 1 and sim.current_index == 0
+
+    def test_carry_over_index_delta(
+        self,
+        basic_ladders: Tuple[LadderSpec, ...],
+        basic_session_config: SessionConfig,
+        null_rng: np.random.Generator,
+    ) -> None:
+        """carry_over_index_delta moves to the offset in the next ladder."""
+        sim, should_stop = self._bridge(
+            basic_ladders, "carry_over_index_delta",
+            basic_session_config, null_rng,
+        )
+        assert not should_stop
+        assert sim.current_ladder == 1 and sim.current_index == 0
+
+    def test_stop_at_table_limit(
+        self,
+        basic_ladders: Tuple[LadderSpec, ...],
+        basic_session_config: SessionConfig,
+        null_rng: np.random.Generator,
+    ) -> None:
+        """stop_at_table_limit ends the session."""
+        sim, should_stop = self._bridge(
+            basic_ladders, "stop_at_table_limit",
+            basic_session_config, null_rng,
+        )
+        assert should_stop
+        assert sim.stop_reason == "table_limit"
+
+
+class TestResetState:
+    """Tests for reusing a simulator through reset_state."""
+
+    def test_reset_matches_fresh_simulator(
+        self,
+        basic_ladders: Tuple[LadderSpec, ...],
+        basic_session_config: SessionConfig,
+    ) -> None:
+        """A reset and reseeded simulator replays a fresh one exactly."""
+        strategy = StrategyConfig(
+            ladders=basic_ladders, bridging_policy="carry_over_index_delta"
+        )
+        sim = SessionSimulator(
+            strategy, basic_session_config, np.random.default_rng(1)
+        )
+        sim.run()
+
+        sim.reset_state(rng_seed=7)
+        fresh = SessionSimulator(strategy, basic_session_config, make_rng(7))
+        assert sim.run() == fresh.run()
+
+
+class TestRunAfterStop:
+    """Tests for calling run on a session that has already stopped."""
+
+    def test_second_run_plays_no_rounds(
+        self,
+        basic_ladders: Tuple[LadderSpec, ...],
+        basic_session_config: SessionConfig,
+    ) -> None:
+        """A second run leaves rounds_played and final_pnl unchanged."""
+        strategy = StrategyConfig(
+            ladders=basic_ladders, bridging_policy="stop_at_table_limit"
+        )
+        sim = SessionSimulator(
+            strategy, basic_session_config, np.random.default_rng(1)
+        )
+        first = sim.run()
+        second = sim.run()
+        assert second.rounds_played == first.rounds_played
+        assert second.final_pnl == first.final_pnl
@@ -0,0 +1,180 @@
+"""
+Tests for the optional Numba session kernels.
+
+Skipped when numba is not installed. Each compiled session is checked
+against SessionSimulator driven by the same legacy Mersenne Twister seed.
+"""
+
+import pytest
+import numpy as np
+from typing import Callable, Tuple
+
+pytest.importorskip("numba")
+
+from simulator import (
+    GameSpec,
+    LadderSpec,
+    StrategyConfig,
+    SessionConfig,
+    SessionSimulator,
+    STOP_RUNNING,
+    STOP_PROFIT_TARGET,
+    STOP_STOP_LOSS,
+    STOP_MAX_ROUNDS,
+    STOP_TABLE_LIMIT,
+    STOP_BANKROLL_EXHAUSTED,
+)
+from simulator_numba import (
+    POLICY_FNS,
+    run_sessions_numba,
+    _flat_ladders,
+    _step_core,
+)
+
+
+POLICIES = [
+    "advance_to_next_ladder_start",
+    "carry_over_index_delta",
+    "stop_at_table_limit",
+]
+
+
+def _legacy_generator(seed: int) -> np.random.Generator:
+    """Generator over the same MT19937 stream as np.random.seed(seed)."""
+    bit_generator = np.random.MT19937()
+    bit_generator.state = np.random.RandomState(seed).get_state(legacy=False)
+    return np.random.Generator(bit_generator)
+
+
+def _run_kernel(strategy: StrategyConfig, config: SessionConfig, seed: int):
+    """Run one compiled session and return (result tuple, touches)."""
+    touches = np.zeros(len(strategy.ladders), dtype=np.int64)
+    table_max = np.inf if config.table_max is None else config.table_max
+    out = POLICY_FNS[strategy.bridging_policy](
+        *_flat_ladders(strategy),
+        config.game_spec.p_win,
+        config.game_spec.payout_ratio,
+        config.bankroll,
+        config.profit_target,
+        config.stop_loss_abs,
+        config.max_rounds,
+        table_max,
+        strategy.crossover_offset,
+        strategy.recovery_target_pct,
+        seed,
+        touches,
+    )
+    return out, touches
+
+
+class TestMatchesSessionSimulator:
+    """Compiled sessions agree with the scalar simulator."""
+
+    @pytest.mark.parametrize("policy", POLICIES)
+    def test_matches_scalar_per_policy(
+        self,
+        three_ladder_setup: Tuple[LadderSpec, ...],
+        even_money_game: GameSpec,
+        policy: str,
+    ) -> None:
+        """Same seed gives the same session for every policy."""
+        strategy = StrategyConfig(
+            ladders=three_ladder_setup,
+            bridging_policy=policy,
+            recovery_target_pct=0.5,
+            crossover_offset=1,
+        )
+        config = SessionConfig(
+            bankroll=20000.0,
+            profit_target=300.0,
+            stop_loss_abs=4000.0,
+            game_spec=even_money_game,
+            max_rounds=600,
+            table_max=2500.0,
+        )
+        for seed in range(25):
+            out, touches = _run_kernel(strategy, config, seed)
+            scalar = SessionSimulator(
+                strategy, config, _legacy_generator(seed)
+            ).run()
+
+            assert (out[0] == STOP_PROFIT_TARGET) == scalar.hit_target
+            assert (out[0] == STOP_STOP_LOSS) == scalar.hit_stop_loss
+            assert (out[0] == STOP_MAX_ROUNDS) == scalar.hit_max_rounds
+            assert (out[0] == STOP_TABLE_LIMIT) == scalar.hit_table_limit
+            assert (
+                out[0] == STOP_BANKROLL_EXHAUSTED
+            ) == scalar.bankroll_exhausted
+            assert out[1] == scalar.final_pnl
+            assert out[2] == scalar.rounds_played
+            assert out[3] == scalar.total_wagered
+            assert out[4] == scalar.max_stake_seen
+            assert out[5] == scalar.max_drawdown
+            assert out[6] == scalar.top_of_ladder_touches
+            assert out[7] == scalar.final_ladder
+            assert out[8] == scalar.final_index
+            assert list(touches) == [
+                scalar.ladder_touches[i] for i in range(len(touches))
+            ]
+
+
+class TestStepCore:
+    """The compiled step agrees with SessionSimulator.step_index."""
+
+    @pytest.mark.parametrize("policy", POLICIES)
+    def test_matches_step_index(
+        self, simulator_factory: Callable[..., SessionSimulator], policy: str
+    ) -> None:
+        """Every (ladder, index, won, recovery) state steps identically."""
+        sim = simulator_factory(policy, n_ladders=3)
+        strategy = sim.strategy
+        _, _, ladder_lens = _flat_ladders(strategy)
+        # (pnl, in_recovery, recovery_target); only carry_over enters recovery
+        states = [(-50.0, False, 0.0), (40.0, False, 0.0)]
+        if policy == "carry_over_index_delta":
+            states += [(-40.0, True, -25.0), (-10.0, True, -25.0)]
+
+        for ladder in range(len(strategy.ladders)):
+            for index in range(int(ladder_lens[ladder])):
+                for won in (False, True):
+                    for pnl, in_recovery, target in states:
+                        sim.reset_state(ladder=ladder, index=index, pnl=pnl)
+                        sim.in_recovery = in_recovery
+                        sim.recovery_target_pnl = target
+                        stopped = sim.step_index(won=won)
+
+                        result = _step_core(
+                            ladder, index, pnl, won,
+                            int(strategy._policy_id), in_recovery, target,
+                            ladder_lens, strategy.recovery_target_pct,
+                            strategy.crossover_offset,
+                        )
+                        assert result == (
+                            sim.current_ladder,
+                            sim.current_index,
+                            sim.in_recovery,
+                            sim.recovery_target_pnl,
+                            STOP_TABLE_LIMIT if stopped else 0,
+                            sim.top_touches == 1,
+                        )
+
+
+class TestParallelDriver:
+    """Batch runs through the parallel driver."""
+
+    def test_every_session_stops_and_is_deterministic(
+        self,
+        recovery_strategy: StrategyConfig,
+        basic_session_config: SessionConfig,
+    ) -> None:
+        """Every session stops once and the same seed repeats the batch."""
+        first = run_sessions_numba(
+            recovery_strategy, basic_session_config, 500, np.random.default_rng(7)
+        )
+        second = run_sessions_numba(
+            recovery_strategy, basic_session_config, 500, np.random.default_rng(7)
+        )
+        assert np.all(first.stop_code != STOP_RUNNING)
+        assert np.all(first.ladder_touches.sum(axis=1) == first.rounds_played)
+        np.testing.assert_array_equal(first.final_pnl, second.final_pnl)
+        np.testing.assert_array_equal(first.stop_code, second.stop_code)
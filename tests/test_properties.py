@@ -6,12 +6,9 @@ Tests invariants that should hold for all valid inputs.
 
 import pytest
 import numpy as np
-from hypothesis import given, strategies as st, assume, settings
-
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from functools import lru_cache
+from typing import Tuple
+from hypothesis import Phase, given, strategies as st, settings
 
 from simulator import (
     LadderSpec,
@@ -21,41 +18,84 @@ from simulator import (
     GameSpec,
 )
 
+# The properties below are cheap invariants: a small, derandomized budget
+# covers them and keeps runs reproducible. Applied per test so other
+# modules keep Hypothesis' own defaults.
+FAST = settings(
+    max_examples=25,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.shrink],
+    derandomize=True,
+    deadline=None,
+)
+
+# Hashable ladder descriptions: ((name, stakes), ...)
+LaddersKey = Tuple[Tuple[str, Tuple[float, ...]], ...]
+
+TWO_LADDERS: LaddersKey = (
+    ("L1", (10.0, 20.0, 30.0)),
+    ("L2", (100.0, 200.0, 300.0)),
+)
+WIDE_SECOND_LADDER: LaddersKey = (
+    ("L1", (10.0, 20.0, 30.0)),
+    ("L2", (100.0, 200.0, 300.0, 400.0, 500.0)),
+)
+
+
+@lru_cache(maxsize=None)
+def _game(name: str, payout_ratio: float, p_win: float) -> GameSpec:
+    """Shared GameSpec per parameter tuple."""
+    return GameSpec(name=name, payout_ratio=payout_ratio, p_win=p_win)
+
+
+@lru_cache(maxsize=None)
+def _strategy(
+    ladders_key: LaddersKey, policy: str, pct: float, offset: int
+) -> StrategyConfig:
+    """Shared StrategyConfig per parameter tuple, so repeated examples reuse it."""
+    return StrategyConfig(
+        ladders=[LadderSpec(name, list(stakes)) for name, stakes in ladders_key],
+        bridging_policy=policy,
+        recovery_target_pct=pct,
+        crossover_offset=offset,
+    )
+
 
 class TestRecoveryTargetProperties:
     """Property-based tests for recovery target calculation."""
 
-    @given(
-        pnl=st.floats(min_value=-10000, max_value=0, allow_nan=False),
-        recovery_pct=st.floats(min_value=0.01, max_value=1.0, allow_nan=False),
-    )
-    def test_recovery_target_always_gte_pnl(
-        self, pnl: float, recovery_pct: float
-    ) -> None:
-        """Recovery target is always >= current PnL when in loss."""
-        target = pnl + abs(pnl) * recovery_pct
-        assert target >= pnl
+    def test_recovery_target_invariants(self) -> None:
+        """Target bounds hold over a large batch of (pnl, pct) pairs."""
+        rng = np.random.default_rng(0)
+        pnl = rng.uniform(-10000, 0, 10_000)
+        pct = rng.uniform(0.01, 1.0, 10_000)
+
+        target = pnl + np.abs(pnl) * pct
+        # Recovery target is always >= current PnL when in loss
+        assert np.all(target >= pnl)
+        # ... and never above breakeven (0 only at 100%)
+        assert np.all(target[pnl < 0] <= 0)
+
+        # 100% recovery targets breakeven
+        full = pnl + np.abs(pnl) * 1.0
+        assert np.all(np.abs(full) < 1e-10)
 
     @given(
-        pnl=st.floats(min_value=-10000, max_value=0, allow_nan=False),
+        # Strictly in loss, bounded in the strategy rather than by assume()
+        pnl=st.floats(
+            min_value=-10000,
+            max_value=-1e-9,
+            allow_nan=False,
+            allow_infinity=False,
+        ),
         recovery_pct=st.floats(min_value=0.01, max_value=1.0, allow_nan=False),
     )
-    def test_recovery_target_always_lte_zero_when_in_loss(
+    @settings(FAST, max_examples=5)
+    def test_recovery_target_between_pnl_and_breakeven(
         self, pnl: float, recovery_pct: float
     ) -> None:
-        """Recovery target is always <= 0 when starting in loss (except at 100%)."""
-        assume(pnl < 0)  # Only when actually in loss
+        """Recovery target lies in [pnl, 0] when starting in loss."""
         target = pnl + abs(pnl) * recovery_pct
-        # At 100% recovery, target = 0. Otherwise target < 0
-        assert target <= 0
-
-    @given(
-        pnl=st.floats(min_value=-10000, max_value=-0.01, allow_nan=False),
-    )
-    def test_full_recovery_targets_breakeven(self, pnl: float) -> None:
-        """100% recovery target equals zero (breakeven)."""
-        target = pnl + abs(pnl) * 1.0
-        assert abs(target) < 1e-10  # Approximately zero
+        assert pnl <= target <= 0
 
 
 class TestCrossoverOffsetProperties:
@@ -64,25 +104,17 @@ class TestCrossoverOffsetProperties:
     @given(
         offset=st.integers(min_value=0, max_value=10),
     )
-    @settings(max_examples=20)
+    @settings(FAST, max_examples=20)
     def test_offset_applied_correctly(self, offset: int) -> None:
         """Crossover offset is correctly applied after bridging."""
-        ladders = [
-            LadderSpec("L1", [10.0, 20.0, 30.0]),
-            LadderSpec("L2", [100.0, 200.0, 300.0, 400.0, 500.0]),
-        ]
-        strategy = StrategyConfig(
-            ladders=ladders,
-            bridging_policy="carry_over_index_delta",
-            recovery_target_pct=0.5,
-            crossover_offset=offset,
+        strategy = _strategy(
+            WIDE_SECOND_LADDER, "carry_over_index_delta", 0.5, offset
         )
-        game = GameSpec(name="test", payout_ratio=1.0, p_win=0.5)
         config = SessionConfig(
             bankroll=10000.0,
             profit_target=1000.0,
             stop_loss_abs=1000.0,
-            game_spec=game,
+            game_spec=_game("test", 1.0, 0.5),
         )
         rng = np.random.default_rng(42)
         sim = SessionSimulator(strategy, config, rng)
@@ -106,6 +138,7 @@ class TestLadderSpecProperties:
             max_size=20,
         )
     )
+    @FAST
     def test_valid_stakes_create_ladder(self, stakes: list) -> None:
         """Any list of positive floats creates a valid ladder."""
         ladder = LadderSpec("test", stakes)
@@ -119,13 +152,15 @@ class TestLadderSpecProperties:
         ),
         index=st.integers(min_value=-10, max_value=30),
     )
+    @FAST
     def test_get_stake_always_returns_valid(
         self, stakes: list, index: int
     ) -> None:
         """get_stake always returns a value from the stakes list."""
         ladder = LadderSpec("test", stakes)
+        stakes_set = set(stakes)
         stake = ladder.get_stake(index)
-        assert stake in stakes
+        assert stake in stakes_set
 
     @given(
         stakes=st.lists(
@@ -134,6 +169,7 @@ class TestLadderSpecProperties:
             max_size=20,
         ),
     )
+    @FAST
     def test_max_index_correct(self, stakes: list) -> None:
         """max_index is always len(stakes) - 1."""
         ladder = LadderSpec("test", stakes)
@@ -149,6 +185,7 @@ class TestStrategyConfigProperties:
         ),
         offset=st.integers(min_value=0, max_value=10),
     )
+    @FAST
     def test_valid_params_create_config(
         self, recovery_pct: float, offset: int
     ) -> None:
@@ -164,76 +201,61 @@ class TestStrategyConfigProperties:
         assert config.crossover_offset == offset
 
 
+@pytest.fixture(scope="module")
+def short_session() -> SessionSimulator:
+    """One reusable 100-round simulator, reseeded per example."""
+    strategy = _strategy(TWO_LADDERS, "carry_over_index_delta", 0.5, 1)
+    config = SessionConfig(
+        bankroll=10000.0,
+        profit_target=100.0,
+        stop_loss_abs=500.0,
+        game_spec=_game("test", 1.0, 0.5),
+        max_rounds=100,
+    )
+    return SessionSimulator(strategy, config, np.random.default_rng(0))
+
+
 class TestSessionSimulatorInvariants:
     """Property-based tests for SessionSimulator invariants."""
 
     @given(
-        seed=st.integers(min_value=0, max_value=2**32 - 1),
+        seeds=st.lists(
+            st.integers(min_value=0, max_value=2**32 - 1),
+            min_size=8,
+            max_size=8,
+        ),
     )
-    @settings(max_examples=10)
-    def test_deterministic_with_same_seed(self, seed: int) -> None:
+    @settings(FAST, max_examples=3)
+    def test_deterministic_with_same_seed(
+        self, short_session: SessionSimulator, seeds: list
+    ) -> None:
         """Same seed produces same results."""
-        ladders = [
-            LadderSpec("L1", [10.0, 20.0, 30.0]),
-            LadderSpec("L2", [100.0, 200.0, 300.0]),
-        ]
-        strategy = StrategyConfig(
-            ladders=ladders,
-            bridging_policy="carry_over_index_delta",
-            recovery_target_pct=0.5,
-            crossover_offset=1,
-        )
-        game = GameSpec(name="test", payout_ratio=1.0, p_win=0.5)
-        config = SessionConfig(
-            bankroll=10000.0,
-            profit_target=100.0,
-            stop_loss_abs=500.0,
-            game_spec=game,
-            max_rounds=100,
-        )
+        reset = short_session.reset_state
+        run = short_session.run
 
-        # Run two simulations with same seed
-        rng1 = np.random.default_rng(seed)
-        sim1 = SessionSimulator(strategy, config, rng1)
-        for _ in range(config.max_rounds):
-            if not sim1.play_round():
-                break
-        result1_pnl = sim1.pnl
-        result1_rounds = sim1.rounds
-
-        rng2 = np.random.default_rng(seed)
-        sim2 = SessionSimulator(strategy, config, rng2)
-        for _ in range(config.max_rounds):
-            if not sim2.play_round():
-                break
-        result2_pnl = sim2.pnl
-        result2_rounds = sim2.rounds
-
-        assert result1_pnl == result2_pnl
-        assert result1_rounds == result2_rounds
+        def outcome(seed: int) -> tuple:
+            reset(rng_seed=seed)
+            result = run()
+            return result.final_pnl, result.rounds_played
+
+        # Replay the whole batch of seeds twice and compare in one shot
+        first = np.array([outcome(seed) for seed in seeds])
+        second = np.array([outcome(seed) for seed in seeds])
+
+        assert np.array_equal(first, second)
 
     @given(
         pnl=st.floats(min_value=-1000, max_value=1000, allow_nan=False),
     )
-    @settings(max_examples=20)
+    @settings(FAST, max_examples=20)
     def test_recovery_completes_when_target_met(self, pnl: float) -> None:
         """Recovery mode exits when PnL >= target."""
-        ladders = [
-            LadderSpec("L1", [10.0, 20.0, 30.0]),
-            LadderSpec("L2", [100.0, 200.0, 300.0]),
-        ]
-        strategy = StrategyConfig(
-            ladders=ladders,
-            bridging_policy="carry_over_index_delta",
-            recovery_target_pct=0.5,
-            crossover_offset=0,
-        )
-        game = GameSpec(name="test", payout_ratio=1.0, p_win=0.5)
+        strategy = _strategy(TWO_LADDERS, "carry_over_index_delta", 0.5, 0)
         config = SessionConfig(
             bankroll=10000.0,
             profit_target=1000.0,
             stop_loss_abs=1000.0,
-            game_spec=game,
+            game_spec=_game("test", 1.0, 0.5),
         )
         rng = np.random.default_rng(42)
         sim = SessionSimulator(strategy, config, rng)
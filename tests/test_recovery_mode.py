@@ -6,36 +6,25 @@ and recovery completion logic.
 """
 
 import pytest
-import numpy as np
-from typing import List
+from typing import Callable
 
-import sys
-from pathlib import Path
+from simulator import SessionSimulator
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from simulator import (
-    GameSpec,
-    LadderSpec,
-    StrategyConfig,
-    SessionConfig,
-    SessionSimulator,
-)
+CARRY = "carry_over_index_delta"
 
 
 class TestRecoveryModeEntry:
     """Tests for entering recovery mode."""
 
     def test_recovery_entry_on_loss_at_top(
-        self, recovery_simulator: SessionSimulator
+        self, simulator_factory: Callable[..., SessionSimulator]
     ) -> None:
         """Loss at top of ladder triggers recovery mode."""
-        sim = recovery_simulator
+        sim = simulator_factory(CARRY)
 
         # Position at top of L1 (index 2)
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.pnl = -50.0
+        sim.reset_state(ladder=0, index=2, pnl=-50.0)
 
         # Trigger loss at top -> should bridge and enter recovery
         sim.step_index(won=False)
@@ -45,14 +34,11 @@ class TestRecoveryModeEntry:
         assert sim.current_index == 1  # crossover_offset = 1
 
     def test_no_recovery_on_win_at_top(
-        self, recovery_simulator: SessionSimulator
+        self, simulator_factory: Callable[..., SessionSimulator]
     ) -> None:
         """Win at top of ladder does not trigger recovery mode."""
-        sim = recovery_simulator
-
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.pnl = -50.0
+        sim = simulator_factory(CARRY)
+        sim.reset_state(ladder=0, index=2, pnl=-50.0)
 
         # Win at top -> should stay in ladder, no bridging
         sim.step_index(won=True)
@@ -62,14 +48,11 @@ class TestRecoveryModeEntry:
         assert sim.current_index == 0  # Moved down 2
 
     def test_no_recovery_on_loss_not_at_top(
-        self, recovery_simulator: SessionSimulator
+        self, simulator_factory: Callable[..., SessionSimulator]
     ) -> None:
         """Loss not at top of ladder does not trigger recovery mode."""
-        sim = recovery_simulator
-
-        sim.current_ladder = 0
-        sim.current_index = 1  # Not at top (top is 2)
-        sim.pnl = -50.0
+        sim = simulator_factory(CARRY)
+        sim.reset_state(ladder=0, index=1, pnl=-50.0)  # Not at top (top is 2)
 
         sim.step_index(won=False)
 
@@ -81,214 +64,92 @@ class TestRecoveryModeEntry:
 class TestRecoveryTargetCalculation:
     """Tests for recovery target PnL calculation."""
 
-    def test_recovery_target_formula(
-        self, recovery_simulator: SessionSimulator
-    ) -> None:
-        """Verify target = pnl + abs(pnl) * recovery_target_pct."""
-        sim = recovery_simulator
-
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.pnl = -50.0
-
-        sim.step_index(won=False)
-
-        # Target = -50 + (50 * 0.5) = -25
-        expected_target = -50.0 + (50.0 * 0.5)
-        assert abs(sim.recovery_target_pnl - expected_target) < 0.001
-
-    def test_recovery_target_with_different_pct(
-        self,
-        basic_ladders: List[LadderSpec],
-        basic_session_config: SessionConfig,
-        seeded_rng: np.random.Generator,
-    ) -> None:
-        """Test target calculation with 75% recovery."""
-        strategy = StrategyConfig(
-            ladders=basic_ladders,
-            bridging_policy="carry_over_index_delta",
-            recovery_target_pct=0.75,
-            crossover_offset=0,
-        )
-        sim = SessionSimulator(strategy, basic_session_config, seeded_rng)
-
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.pnl = -100.0
-
-        sim.step_index(won=False)
-
-        # Target = -100 + (100 * 0.75) = -25
-        expected_target = -100.0 + (100.0 * 0.75)
-        assert abs(sim.recovery_target_pnl - expected_target) < 0.001
-
-    def test_recovery_target_full_recovery(
+    @pytest.mark.parametrize(
+        "pct,pnl,expected",
+        [
+            (0.5, -50.0, -25.0),  # -50 + (50 * 0.5)
+            (0.75, -100.0, -25.0),  # -100 + (100 * 0.75)
+            (1.0, -200.0, 0.0),  # Full recovery: back to breakeven
+        ],
+    )
+    def test_recovery_target(
         self,
-        basic_ladders: List[LadderSpec],
-        basic_session_config: SessionConfig,
-        seeded_rng: np.random.Generator,
+        simulator_factory: Callable[..., SessionSimulator],
+        pct: float,
+        pnl: float,
+        expected: float,
     ) -> None:
-        """Test target calculation with 100% recovery (back to breakeven)."""
-        strategy = StrategyConfig(
-            ladders=basic_ladders,
-            bridging_policy="carry_over_index_delta",
-            recovery_target_pct=1.0,
-            crossover_offset=0,
-        )
-        sim = SessionSimulator(strategy, basic_session_config, seeded_rng)
-
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.pnl = -200.0
+        """Verify target = pnl + abs(pnl) * recovery_target_pct."""
+        sim = simulator_factory(CARRY, recovery_pct=pct, offset=0)
+        sim.reset_state(ladder=0, index=2, pnl=pnl)
 
         sim.step_index(won=False)
 
-        # Target = -200 + (200 * 1.0) = 0 (breakeven)
-        assert abs(sim.recovery_target_pnl - 0.0) < 0.001
+        assert abs(sim.recovery_target_pnl - expected) < 0.001
 
 
 class TestCrossoverOffset:
     """Tests for crossover_offset application."""
 
+    @pytest.mark.parametrize("offset", [0, 1, 2])  # Max index in L2 is 2
     def test_crossover_offset_applied(
-        self, recovery_simulator: SessionSimulator
+        self, simulator_factory: Callable[..., SessionSimulator], offset: int
     ) -> None:
         """Verify index = crossover_offset in next ladder."""
-        sim = recovery_simulator  # crossover_offset = 1
-
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.pnl = -50.0
-
-        sim.step_index(won=False)
-
-        assert sim.current_index == 1  # crossover_offset
-
-    def test_crossover_offset_zero(
-        self,
-        basic_ladders: List[LadderSpec],
-        basic_session_config: SessionConfig,
-        seeded_rng: np.random.Generator,
-    ) -> None:
-        """Test with crossover_offset = 0."""
-        strategy = StrategyConfig(
-            ladders=basic_ladders,
-            bridging_policy="carry_over_index_delta",
-            recovery_target_pct=0.5,
-            crossover_offset=0,
-        )
-        sim = SessionSimulator(strategy, basic_session_config, seeded_rng)
-
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.pnl = -50.0
-
-        sim.step_index(won=False)
-
-        assert sim.current_index == 0
-
-    def test_crossover_offset_high(
-        self,
-        basic_ladders: List[LadderSpec],
-        basic_session_config: SessionConfig,
-        seeded_rng: np.random.Generator,
-    ) -> None:
-        """Test with high crossover_offset (within bounds)."""
-        strategy = StrategyConfig(
-            ladders=basic_ladders,
-            bridging_policy="carry_over_index_delta",
-            recovery_target_pct=0.5,
-            crossover_offset=2,  # Max index in L2 is also 2
-        )
-        sim = SessionSimulator(strategy, basic_session_config, seeded_rng)
-
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.pnl = -50.0
+        sim = simulator_factory(CARRY, offset=offset)
+        sim.reset_state(ladder=0, index=2, pnl=-50.0)
 
         sim.step_index(won=False)
 
-        assert sim.current_index == 2
+        assert sim.current_index == offset
 
 
 class TestRecoveryCompletion:
     """Tests for recovery completion and reset."""
 
-    def test_recovery_completion_resets_position(
-        self, recovery_simulator: SessionSimulator
+    @pytest.mark.parametrize(
+        "new_pnl,still_in_recovery",
+        [
+            (150.0, False),  # Well above target of -25
+            (-25.0, False),  # Exactly at target
+            (-30.0, True),  # Below target
+        ],
+    )
+    def test_recovery_completion(
+        self,
+        simulator_factory: Callable[..., SessionSimulator],
+        new_pnl: float,
+        still_in_recovery: bool,
     ) -> None:
-        """PnL >= target resets to ladder 0, index 0."""
-        sim = recovery_simulator
+        """Recovery completes, resetting to ladder 0, once PnL >= target."""
+        sim = simulator_factory(CARRY)
 
         # Enter recovery mode
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.pnl = -50.0
+        sim.reset_state(ladder=0, index=2, pnl=-50.0)
         sim.step_index(won=False)
 
         assert sim.in_recovery is True
         assert sim.recovery_target_pnl == -25.0  # -50 + 50*0.5
 
-        # Simulate winning enough to exceed target
-        sim.pnl = 150.0  # Well above target of -25
-        sim.step_index(won=True)
-
-        assert sim.in_recovery is False
-        assert sim.recovery_target_pnl == 0.0
-        assert sim.current_ladder == 0
-        assert sim.current_index == 0
-
-    def test_recovery_completion_exact_target(
-        self, recovery_simulator: SessionSimulator
-    ) -> None:
-        """Recovery completes when PnL exactly equals target."""
-        sim = recovery_simulator
-
-        # Enter recovery mode
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.pnl = -50.0
-        sim.step_index(won=False)
-
-        # Set PnL exactly to target
-        sim.pnl = -25.0  # Exactly at target
+        sim.pnl = new_pnl
         sim.step_index(won=True)
 
-        assert sim.in_recovery is False
-        assert sim.current_ladder == 0
-        assert sim.current_index == 0
-
-    def test_recovery_not_complete_below_target(
-        self, recovery_simulator: SessionSimulator
-    ) -> None:
-        """Recovery does not complete when PnL below target."""
-        sim = recovery_simulator
-
-        # Enter recovery mode
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.pnl = -50.0
-        sim.step_index(won=False)
-
-        # PnL still below target
-        sim.pnl = -30.0  # Below target of -25
-        sim.step_index(won=True)
-
-        assert sim.in_recovery is True  # Still in recovery
+        assert sim.in_recovery is still_in_recovery
+        if not still_in_recovery:
+            assert sim.recovery_target_pnl == 0.0
+            assert sim.current_ladder == 0
+            assert sim.current_index == 0
 
 
 class TestEdgeCases:
     """Tests for edge cases."""
 
     def test_already_in_profit_edge_case(
-        self, recovery_simulator: SessionSimulator
+        self, simulator_factory: Callable[..., SessionSimulator]
     ) -> None:
         """Bridging when PnL > 0 sets target to current PnL."""
-        sim = recovery_simulator
-
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.pnl = 100.0  # Already in profit
+        sim = simulator_factory(CARRY)
+        sim.reset_state(ladder=0, index=2, pnl=100.0)  # Already in profit
 
         sim.step_index(won=False)
 
@@ -297,15 +158,13 @@ class TestEdgeCases:
         assert sim.recovery_target_pnl == 100.0
 
     def test_last_ladder_stops_session(
-        self, recovery_simulator: SessionSimulator
+        self, simulator_factory: Callable[..., SessionSimulator]
     ) -> None:
         """At last ladder, session stops instead of bridging."""
-        sim = recovery_simulator
+        sim = simulator_factory(CARRY)
 
         # Position at top of last ladder (L2)
-        sim.current_ladder = 1  # Last ladder
-        sim.current_index = 2  # Top
-        sim.pnl = -50.0
+        sim.reset_state(ladder=1, index=2, pnl=-50.0)
 
         stopped = sim.step_index(won=False)
 
@@ -314,24 +173,13 @@ class TestEdgeCases:
         assert sim.stop_reason == "table_limit"
 
     def test_multiple_bridges_recovery_target_set_once(
-        self,
-        three_ladder_setup: List[LadderSpec],
-        basic_session_config: SessionConfig,
-        seeded_rng: np.random.Generator,
+        self, simulator_factory: Callable[..., SessionSimulator]
     ) -> None:
         """Recovery target is set only on first bridge (not updated on subsequent)."""
-        strategy = StrategyConfig(
-            ladders=three_ladder_setup,
-            bridging_policy="carry_over_index_delta",
-            recovery_target_pct=0.5,
-            crossover_offset=0,
-        )
-        sim = SessionSimulator(strategy, basic_session_config, seeded_rng)
+        sim = simulator_factory(CARRY, offset=0, n_ladders=3)
 
         # First bridge
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.pnl = -50.0
+        sim.reset_state(ladder=0, index=2, pnl=-50.0)
         sim.step_index(won=False)
 
         first_target = sim.recovery_target_pnl
@@ -347,15 +195,13 @@ class TestEdgeCases:
         assert sim.current_ladder == 2  # Now in L3
 
     def test_win_during_recovery_moves_down_ladder(
-        self, recovery_simulator: SessionSimulator
+        self, simulator_factory: Callable[..., SessionSimulator]
     ) -> None:
         """Win during recovery mode moves down within ladder normally."""
-        sim = recovery_simulator
+        sim = simulator_factory(CARRY)
 
         # Enter recovery mode
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.pnl = -50.0
+        sim.reset_state(ladder=0, index=2, pnl=-50.0)
         sim.step_index(won=False)
 
         # Now in L2, index 1, in recovery
@@ -376,16 +222,14 @@ class TestTopTouchTracking:
     """Tests for top_touches counter."""
 
     def test_top_touch_incremented_on_bridge(
-        self, recovery_simulator: SessionSimulator
+        self, simulator_factory: Callable[..., SessionSimulator]
     ) -> None:
         """top_touches increments when bridging occurs."""
-        sim = recovery_simulator
+        sim = simulator_factory(CARRY)
+        sim.reset_state(ladder=0, index=2, pnl=-50.0)
 
         initial_touches = sim.top_touches
 
-        sim.current_ladder = 0
-        sim.current_index = 2
-        sim.pnl = -50.0
         sim.step_index(won=False)
 
         assert sim.top_touches == initial_touches + 1
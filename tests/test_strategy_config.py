@@ -1,33 +1,39 @@
 """
 Tests for StrategyConfig validation and preset loading.
 
-Tests configuration validation, preset loading from .ini files,
+Tests configuration validation, preset loading from .toml and .ini files,
 and CLI argument merging.
 """
 
+import io
+import re
 import pytest
-import tempfile
 from pathlib import Path
-from typing import List
-
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from typing import Tuple
 
 from simulator import LadderSpec, StrategyConfig
 from config import (
     load_preset,
     list_presets,
+    load_all_presets,
     create_strategy_from_preset,
     merge_cli_with_preset,
+    PresetCatalog,
     PresetConfig,
 )
 
+# Error-message patterns, compiled once for every pytest.raises(match=...)
+_RX_LADDERS = re.compile("at least one ladder")
+_RX_RECOVERY = re.compile("recovery_target_pct")
+_RX_OFFSET = re.compile("crossover_offset")
+_RX_POLICY = re.compile("Unknown bridging policy")
+_RX_NOT_FOUND = re.compile("not found")
+
 
 class TestStrategyConfigValidation:
     """Tests for StrategyConfig validation."""
 
-    def test_valid_config(self, basic_ladders: List[LadderSpec]) -> None:
+    def test_valid_config(self, basic_ladders: Tuple[LadderSpec, ...]) -> None:
         """Valid configuration creates successfully."""
         config = StrategyConfig(
             ladders=basic_ladders,
@@ -40,57 +46,93 @@ class TestStrategyConfigValidation:
 
     def test_empty_ladders_raises(self) -> None:
         """Empty ladders list raises ValueError."""
-        with pytest.raises(ValueError, match="at least one ladder"):
+        with pytest.raises(ValueError, match=_RX_LADDERS):
             StrategyConfig(ladders=[])
 
     def test_recovery_target_zero_raises(
-        self, basic_ladders: List[LadderSpec]
+        self, basic_ladders: Tuple[LadderSpec, ...]
     ) -> None:
         """recovery_target_pct of 0 raises ValueError."""
-        with pytest.raises(ValueError, match="recovery_target_pct"):
+        with pytest.raises(ValueError, match=_RX_RECOVERY):
             StrategyConfig(
                 ladders=basic_ladders,
                 recovery_target_pct=0.0,
             )
 
     def test_recovery_target_negative_raises(
-        self, basic_ladders: List[LadderSpec]
+        self, basic_ladders: Tuple[LadderSpec, ...]
     ) -> None:
         """Negative recovery_target_pct raises ValueError."""
-        with pytest.raises(ValueError, match="recovery_target_pct"):
+        with pytest.raises(ValueError, match=_RX_RECOVERY):
             StrategyConfig(
                 ladders=basic_ladders,
                 recovery_target_pct=-0.5,
             )
 
     def test_recovery_target_over_one_raises(
-        self, basic_ladders: List[LadderSpec]
+        self, basic_ladders: Tuple[LadderSpec, ...]
     ) -> None:
         """recovery_target_pct over 1.0 raises ValueError."""
-        with pytest.raises(ValueError, match="recovery_target_pct"):
+        with pytest.raises(ValueError, match=_RX_RECOVERY):
             StrategyConfig(
                 ladders=basic_ladders,
                 recovery_target_pct=1.5,
             )
 
     def test_negative_offset_raises(
-        self, basic_ladders: List[LadderSpec]
+        self, basic_ladders: Tuple[LadderSpec, ...]
     ) -> None:
         """Negative crossover_offset raises ValueError."""
-        with pytest.raises(ValueError, match="crossover_offset"):
+        with pytest.raises(ValueError, match=_RX_OFFSET):
             StrategyConfig(
                 ladders=basic_ladders,
                 crossover_offset=-1,
             )
 
+    def test_unknown_policy_raises(
+        self, basic_ladders: Tuple[LadderSpec, ...]
+    ) -> None:
+        """Unknown bridging_policy raises ValueError at construction."""
+        with pytest.raises(ValueError, match=_RX_POLICY):
+            StrategyConfig(
+                ladders=basic_ladders,
+                bridging_policy="double_down",  # type: ignore[arg-type]
+            )
 
-class TestPresetLoading:
-    """Tests for loading presets from .ini files."""
 
-    @pytest.fixture
-    def temp_config_file(self) -> Path:
-        """Create a temporary config file."""
-        content = """
+class TestStakeLookup:
+    """Tests for the precomputed stake table on StrategyConfig."""
+
+    def test_get_stake_matches_ladders(
+        self, basic_ladders: Tuple[LadderSpec, ...]
+    ) -> None:
+        """get_stake agrees with LadderSpec.get_stake, including clamping."""
+        config = StrategyConfig(ladders=basic_ladders)
+        for row, ladder in enumerate(basic_ladders):
+            for index in range(-2, len(ladder.stakes) + 3):
+                assert config.get_stake(row, index) == ladder.get_stake(index)
+
+    def test_flat_stakes_follow_offsets(
+        self, basic_ladders: Tuple[LadderSpec, ...]
+    ) -> None:
+        """Each ladder's stakes sit at its offset in the flat array."""
+        config = StrategyConfig(ladders=basic_ladders)
+        for row, ladder in enumerate(basic_ladders):
+            start = config._ladder_offsets[row]
+            assert config._ladder_lens[row] == len(ladder.stakes)
+            assert tuple(
+                config._stakes_flat[start:start + len(ladder.stakes)]
+            ) == ladder.stakes
+
+    def test_ladder_spec_is_frozen(self) -> None:
+        """LadderSpec stores its stakes as a tuple and cannot be changed."""
+        ladder = LadderSpec("L1", [10.0, 20.0, 30.0])
+        assert ladder.stakes == (10.0, 20.0, 30.0)
+        with pytest.raises(AttributeError):
+            ladder.stakes = (1.0,)  # type: ignore[misc]
+
+
+PRESET_TEXT = """
 [DEFAULT]
 bridging_policy = carry_over_index_delta
 recovery_target_pct = 0.5
@@ -104,60 +146,183 @@ crossover_offset = 2
 recovery_target_pct = 0.25
 crossover_offset = 0
 """
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".ini", delete=False
-        ) as f:
-            f.write(content)
-            return Path(f.name)
 
-    def test_load_default_preset(self, temp_config_file: Path) -> None:
+PRESET_TOML = """
+[DEFAULT]
+bridging_policy = "carry_over_index_delta"
+recovery_target_pct = 0.5
+crossover_offset = 0
+
+[aggressive]
+recovery_target_pct = 0.75
+crossover_offset = 2
+
+[conservative]
+recovery_target_pct = 0.25
+crossover_offset = 0
+"""
+
+
+@pytest.fixture(scope="class")
+def preset_buffer() -> io.StringIO:
+    """In-memory preset file, shared by the tests of a class."""
+    return io.StringIO(PRESET_TEXT)
+
+
+class TestPresetLoading:
+    """Tests for loading presets from .toml and .ini files."""
+
+    @pytest.fixture
+    def temp_config_file(self, tmp_path: Path) -> Path:
+        """Write PRESET_TEXT to a per-test config file."""
+        path = tmp_path / "presets.ini"
+        path.write_text(PRESET_TEXT)
+        return path
+
+    def test_load_default_preset(self, preset_buffer: io.StringIO) -> None:
         """Loading DEFAULT preset returns correct values."""
-        preset = load_preset(temp_config_file, "DEFAULT")
+        preset = load_preset(preset_buffer, "DEFAULT")
         assert preset.name == "DEFAULT"
         assert preset.bridging_policy == "carry_over_index_delta"
         assert preset.recovery_target_pct == 0.5
         assert preset.crossover_offset == 0
 
-    def test_load_named_preset(self, temp_config_file: Path) -> None:
+    def test_load_named_preset(self, preset_buffer: io.StringIO) -> None:
         """Loading named preset returns correct values."""
-        preset = load_preset(temp_config_file, "aggressive")
+        preset = load_preset(preset_buffer, "aggressive")
         assert preset.name == "aggressive"
         assert preset.recovery_target_pct == 0.75
         assert preset.crossover_offset == 2
 
     def test_load_nonexistent_preset_raises(
-        self, temp_config_file: Path
+        self, preset_buffer: io.StringIO
     ) -> None:
         """Loading nonexistent preset raises ValueError."""
-        with pytest.raises(ValueError, match="not found"):
-            load_preset(temp_config_file, "nonexistent")
+        with pytest.raises(ValueError, match=_RX_NOT_FOUND):
+            load_preset(preset_buffer, "nonexistent")
 
     def test_load_nonexistent_file_raises(self) -> None:
         """Loading from nonexistent file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
             load_preset(Path("/nonexistent/path.ini"), "DEFAULT")
 
-    def test_list_presets(self, temp_config_file: Path) -> None:
+    def test_malformed_line_reports_line_number(self, tmp_path: Path) -> None:
+        """A line that is not a header, key/value or comment is rejected."""
+        path = tmp_path / "bad.ini"
+        path.write_text("[DEFAULT]\n; comment\nrecovery_target_pct 0.5\n")
+        with pytest.raises(ValueError, match="Malformed line 3"):
+            load_preset(path, "DEFAULT")
+
+    def test_toml_matches_ini(
+        self, tmp_path: Path, temp_config_file: Path
+    ) -> None:
+        """A .toml preset file loads the same presets as its INI form."""
+        path = tmp_path / "presets.toml"
+        path.write_text(PRESET_TOML)
+        assert load_all_presets(path) == load_all_presets(temp_config_file)
+
+    def test_toml_float_offset_is_rejected(self, tmp_path: Path) -> None:
+        """A fractional TOML crossover_offset fails instead of truncating."""
+        path = tmp_path / "presets.toml"
+        path.write_text("[DEFAULT]\ncrossover_offset = 2.5\n")
+        with pytest.raises(ValueError, match="Invalid crossover_offset"):
+            load_preset(path, "DEFAULT")
+
+    @pytest.mark.parametrize(
+        "line,message",
+        [
+            ("bridging_policy = double_down", "Invalid bridging_policy"),
+            ("recovery_target_pct = abc", "Invalid recovery_target_pct"),
+            ("recovery_target_pct = 1.5", r"must be in \(0, 1\], got 1.5"),
+            ("crossover_offset = 1.5", "Invalid crossover_offset"),
+            ("crossover_offset = -1", "must be >= 0, got -1"),
+        ],
+    )
+    def test_invalid_values_raise(self, line: str, message: str) -> None:
+        """Values that fail coercion or range checks raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            load_preset(io.StringIO(f"[DEFAULT]\n{line}\n"), "DEFAULT")
+
+    def test_buffer_position_is_preserved(self) -> None:
+        """A partly read buffer is parsed whole and keeps its position."""
+        buffer = io.StringIO(PRESET_TEXT)
+        buffer.read(5)
+        assert load_preset(buffer, "aggressive").crossover_offset == 2
+        assert buffer.tell() == 5
+
+    def test_no_file_returns_builtin_default(self) -> None:
+        """DEFAULT without a config file needs no disk access."""
+        preset = load_preset(None)
+        assert preset.name == "DEFAULT"
+        assert preset.bridging_policy == "carry_over_index_delta"
+        assert preset.recovery_target_pct == 0.5
+        assert preset.crossover_offset == 0
+        assert load_preset(None, "DEFAULT") is preset
+
+        with pytest.raises(ValueError, match=_RX_NOT_FOUND):
+            load_preset(None, "aggressive")
+
+    def test_list_presets(self, preset_buffer: io.StringIO) -> None:
         """list_presets returns all available presets."""
-        presets = list_presets(temp_config_file)
+        presets = list_presets(preset_buffer)
         assert "DEFAULT" in presets
         assert "aggressive" in presets
         assert "conservative" in presets
         assert len(presets) == 3
 
+    def test_unchanged_file_is_not_reparsed(
+        self, temp_config_file: Path
+    ) -> None:
+        """Repeated loads of an unchanged file reuse the cached parse."""
+        first = load_preset(temp_config_file, "aggressive")
+        assert load_preset(temp_config_file, "aggressive") is first
+        assert list_presets(temp_config_file) == [
+            "DEFAULT", "aggressive", "conservative"
+        ]
+        assert load_preset(temp_config_file, "aggressive") is first
+
+    def test_edited_file_is_reparsed(self, temp_config_file: Path) -> None:
+        """Cached parses are invalidated when the file changes."""
+        assert load_preset(temp_config_file, "aggressive").crossover_offset == 2
+
+        temp_config_file.write_text(
+            "[DEFAULT]\nrecovery_target_pct = 0.5\n\n"
+            "[aggressive]\nrecovery_target_pct = 0.9\ncrossover_offset = 4\n"
+        )
+
+        preset = load_preset(temp_config_file, "aggressive")
+        assert preset.recovery_target_pct == 0.9
+        assert preset.crossover_offset == 4
+        assert list_presets(temp_config_file) == ["DEFAULT", "aggressive"]
+
+    def test_catalog_serves_validated_presets(
+        self, temp_config_file: Path
+    ) -> None:
+        """PresetCatalog lists sections and reuses validated presets."""
+        catalog = PresetCatalog(temp_config_file)
+        assert catalog.list() == ["DEFAULT", "aggressive", "conservative"]
+
+        preset = catalog.get("conservative")
+        assert preset.recovery_target_pct == 0.25
+        assert preset.bridging_policy == "carry_over_index_delta"
+        assert catalog.get("conservative") is preset
+
+        with pytest.raises(ValueError, match=_RX_NOT_FOUND):
+            catalog.get("nonexistent")
+
 
 class TestPresetFromRealFile:
-    """Tests using the actual presets.ini file."""
+    """Tests using the actual presets.toml file."""
 
     @pytest.fixture
     def presets_file(self) -> Path:
-        """Path to the actual presets.ini file."""
-        return Path(__file__).parent.parent / "presets.ini"
+        """Path to the actual presets.toml file."""
+        return Path(__file__).parent.parent / "presets.toml"
 
     def test_load_aggressive_preset(self, presets_file: Path) -> None:
         """Load aggressive preset from actual file."""
         if not presets_file.exists():
-            pytest.skip("presets.ini not found")
+            pytest.skip("presets.toml not found")
 
         preset = load_preset(presets_file, "aggressive")
         assert preset.recovery_target_pct == 0.75
@@ -166,11 +331,11 @@ class TestPresetFromRealFile:
     def test_load_all_presets(self, presets_file: Path) -> None:
         """All presets in file load without error."""
         if not presets_file.exists():
-            pytest.skip("presets.ini not found")
+            pytest.skip("presets.toml not found")
 
-        presets = list_presets(presets_file)
-        for name in presets:
-            preset = load_preset(presets_file, name)
+        presets = load_all_presets(presets_file)
+        assert list(presets) == list_presets(presets_file)
+        for preset in presets.values():
             assert 0 < preset.recovery_target_pct <= 1
             assert preset.crossover_offset >= 0
 
@@ -178,7 +343,7 @@ class TestPresetFromRealFile:
 class TestCreateStrategyFromPreset:
     """Tests for creating StrategyConfig from PresetConfig."""
 
-    def test_create_strategy(self, basic_ladders: List[LadderSpec]) -> None:
+    def test_create_strategy(self, basic_ladders: Tuple[LadderSpec, ...]) -> None:
         """Strategy created from preset has correct values."""
         preset = PresetConfig(
             name="test",
@@ -194,57 +359,70 @@ class TestCreateStrategyFromPreset:
         assert len(strategy.ladders) == 2
 
 
-class TestMergeCliWithPreset:
-    """Tests for merging CLI arguments with preset values."""
+@pytest.fixture(scope="module")
+def base_preset() -> PresetConfig:
+    """Base preset for the merge tests; frozen, so shared."""
+    return PresetConfig(
+        name="base",
+        bridging_policy="carry_over_index_delta",
+        recovery_target_pct=0.5,
+        crossover_offset=1,
+    )
 
-    @pytest.fixture
-    def base_preset(self) -> PresetConfig:
-        """Base preset for testing."""
-        return PresetConfig(
-            name="base",
-            bridging_policy="carry_over_index_delta",
-            recovery_target_pct=0.5,
-            crossover_offset=1,
-        )
 
-    def test_no_overrides(self, base_preset: PresetConfig) -> None:
-        """No CLI overrides returns preset values."""
-        result = merge_cli_with_preset(base_preset)
-        assert result.recovery_target_pct == 0.5
-        assert result.crossover_offset == 1
+class TestMergeCliWithPreset:
+    """Tests for merging CLI arguments with preset values."""
 
-    def test_override_recovery_pct(self, base_preset: PresetConfig) -> None:
-        """CLI override for recovery_target_pct takes precedence."""
-        result = merge_cli_with_preset(
-            base_preset, cli_recovery_pct=0.75
-        )
-        assert result.recovery_target_pct == 0.75
-        assert result.crossover_offset == 1  # Unchanged
-
-    def test_override_offset(self, base_preset: PresetConfig) -> None:
-        """CLI override for crossover_offset takes precedence."""
-        result = merge_cli_with_preset(base_preset, cli_offset=3)
-        assert result.recovery_target_pct == 0.5  # Unchanged
-        assert result.crossover_offset == 3
-
-    def test_override_policy(self, base_preset: PresetConfig) -> None:
-        """CLI override for bridging_policy takes precedence."""
-        result = merge_cli_with_preset(
-            base_preset, cli_policy="stop_at_table_limit"
-        )
-        assert result.bridging_policy == "stop_at_table_limit"
-
-    def test_multiple_overrides(self, base_preset: PresetConfig) -> None:
-        """Multiple CLI overrides all take precedence."""
-        result = merge_cli_with_preset(
-            base_preset,
-            cli_policy="advance_to_next_ladder_start",
-            cli_recovery_pct=0.9,
-            cli_offset=5,
-        )
-        assert result.bridging_policy == "advance_to_next_ladder_start"
-        assert result.recovery_target_pct == 0.9
-        assert result.crossover_offset == 5
+    @pytest.mark.parametrize(
+        "overrides,expected",
+        [
+            pytest.param(
+                {},
+                {
+                    "bridging_policy": "carry_over_index_delta",
+                    "recovery_target_pct": 0.5,
+                    "crossover_offset": 1,
+                },
+                id="no_overrides",
+            ),
+            pytest.param(
+                {"cli_recovery_pct": 0.75},
+                {"recovery_target_pct": 0.75, "crossover_offset": 1},
+                id="recovery_pct",
+            ),
+            pytest.param(
+                {"cli_offset": 3},
+                {"recovery_target_pct": 0.5, "crossover_offset": 3},
+                id="offset",
+            ),
+            pytest.param(
+                {"cli_policy": "stop_at_table_limit"},
+                {"bridging_policy": "stop_at_table_limit"},
+                id="policy",
+            ),
+            pytest.param(
+                {
+                    "cli_policy": "advance_to_next_ladder_start",
+                    "cli_recovery_pct": 0.9,
+                    "cli_offset": 5,
+                },
+                {
+                    "bridging_policy": "advance_to_next_ladder_start",
+                    "recovery_target_pct": 0.9,
+                    "crossover_offset": 5,
+                },
+                id="multiple",
+            ),
+        ],
+    )
+    def test_merge(
+        self, base_preset: PresetConfig, overrides: dict, expected: dict
+    ) -> None:
+        """CLI overrides take precedence; other fields keep preset values."""
+        result = merge_cli_with_preset(base_preset, **overrides)
+        assert result.name == "base+cli"
+        for field_name, value in expected.items():
+            assert getattr(result, field_name) == value
 
 
 class TestPresetConfigImmutability:
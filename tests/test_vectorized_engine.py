@@ -0,0 +1,488 @@
+"""
+Tests for the vectorized batch session engine.
+
+Checks that run_sessions_vectorized reproduces SessionSimulator exactly
+when both consume the same random stream, and that batch-level
+invariants hold across many sessions.
+"""
+
+import json
+import pytest
+import numpy as np
+from scipy import stats
+from dataclasses import fields, replace
+from typing import Tuple
+
+from simulator import (
+    GameSpec,
+    LadderSpec,
+    StrategyConfig,
+    SessionConfig,
+    SessionSimulator,
+    MonteCarloEngine,
+    SafeTargetFinder,
+    StreamingAggregator,
+    BatchSessionResults,
+    run_sessions_vectorized,
+    make_rng,
+    make_session_rngs,
+    bulk_uniforms,
+    STOP_RUNNING,
+    STOP_PROFIT_TARGET,
+    _moments,
+    _column_medians,
+)
+
+
+POLICIES = [
+    "advance_to_next_ladder_start",
+    "carry_over_index_delta",
+    "stop_at_table_limit",
+]
+
+STOP_REASONS = {
+    1: "profit_target",
+    2: "stop_loss",
+    3: "max_rounds",
+    4: "table_limit",
+    5: "bankroll_exhausted",
+}
+
+
+def _assert_matches_scalar(
+    strategy: StrategyConfig,
+    config: SessionConfig,
+    seed: int,
+    chunk_size: int = 256,
+) -> None:
+    """Run one session through both engines and compare every field."""
+    scalar = SessionSimulator(
+        strategy, config, np.random.default_rng(seed)
+    ).run()
+    batch = run_sessions_vectorized(
+        strategy, config, 1, np.random.default_rng(seed), chunk_size=chunk_size
+    )
+
+    assert STOP_REASONS[int(batch.stop_code[0])] == _stop_reason(scalar)
+    assert batch.final_pnl[0] == scalar.final_pnl
+    assert batch.rounds_played[0] == scalar.rounds_played
+    assert batch.total_wagered[0] == scalar.total_wagered
+    assert batch.max_stake_seen[0] == scalar.max_stake_seen
+    assert batch.max_drawdown[0] == scalar.max_drawdown
+    assert batch.top_of_ladder_touches[0] == scalar.top_of_ladder_touches
+    assert batch.final_ladder[0] == scalar.final_ladder
+    assert batch.final_index[0] == scalar.final_index
+    assert list(batch.ladder_touches[0]) == [
+        scalar.ladder_touches[i] for i in range(len(strategy.ladders))
+    ]
+
+
+def _stop_reason(result) -> str:
+    """Map SessionResult flags back to a stop reason string."""
+    if result.hit_target:
+        return "profit_target"
+    if result.hit_stop_loss:
+        return "stop_loss"
+    if result.hit_max_rounds:
+        return "max_rounds"
+    if result.hit_table_limit:
+        return "table_limit"
+    return "bankroll_exhausted"
+
+
+class TestMatchesSessionSimulator:
+    """Single-session runs agree with the scalar simulator."""
+
+    @pytest.mark.parametrize("policy", POLICIES)
+    def test_matches_scalar_per_policy(
+        self,
+        three_ladder_setup: Tuple[LadderSpec, ...],
+        even_money_game: GameSpec,
+        policy: str,
+    ) -> None:
+        """Identical seeds give identical sessions for every policy."""
+        strategy = StrategyConfig(
+            ladders=three_ladder_setup,
+            bridging_policy=policy,
+            recovery_target_pct=0.5,
+            crossover_offset=1,
+        )
+        config = SessionConfig(
+            bankroll=20000.0,
+            profit_target=300.0,
+            stop_loss_abs=4000.0,
+            game_spec=even_money_game,
+            max_rounds=600,
+        )
+        for seed in range(25):
+            _assert_matches_scalar(strategy, config, seed)
+
+    def test_matches_scalar_across_chunk_boundaries(
+        self,
+        recovery_strategy: StrategyConfig,
+        even_money_game: GameSpec,
+    ) -> None:
+        """Small uniform chunks do not change the drawn sequence."""
+        config = SessionConfig(
+            bankroll=10000.0,
+            profit_target=500.0,
+            stop_loss_abs=2000.0,
+            game_spec=even_money_game,
+            max_rounds=60,
+        )
+        for seed in range(10):
+            _assert_matches_scalar(recovery_strategy, config, seed, chunk_size=7)
+
+    def test_matches_scalar_with_limits(
+        self,
+        three_ladder_setup: Tuple[LadderSpec, ...],
+        even_money_game: GameSpec,
+    ) -> None:
+        """Table max, small bankroll and large offset are handled alike."""
+        strategy = StrategyConfig(
+            ladders=three_ladder_setup,
+            bridging_policy="carry_over_index_delta",
+            recovery_target_pct=0.25,
+            crossover_offset=5,  # Past the top of every ladder
+        )
+        config = SessionConfig(
+            bankroll=2500.0,
+            profit_target=400.0,
+            stop_loss_abs=3000.0,
+            game_spec=even_money_game,
+            max_rounds=500,
+            table_max=2500.0,
+        )
+        for seed in range(25):
+            _assert_matches_scalar(strategy, config, seed)
+
+
+class TestBatchInvariants:
+    """Invariants over many sessions at once."""
+
+    def test_every_session_stops_once(
+        self,
+        recovery_strategy: StrategyConfig,
+        basic_session_config: SessionConfig,
+    ) -> None:
+        """Each session ends with exactly one stop reason."""
+        batch = run_sessions_vectorized(
+            recovery_strategy,
+            basic_session_config,
+            500,
+            np.random.default_rng(7),
+        )
+        assert np.all(batch.stop_code != STOP_RUNNING)
+        flags = np.stack([
+            batch.hit_target,
+            batch.hit_stop_loss,
+            batch.hit_max_rounds,
+            batch.hit_table_limit,
+            batch.bankroll_exhausted,
+        ])
+        assert np.all(flags.sum(axis=0) == 1)
+        assert np.all(batch.rounds_played <= basic_session_config.max_rounds)
+        assert np.all(
+            batch.ladder_touches.sum(axis=1) == batch.rounds_played
+        )
+
+    def test_deterministic_with_same_seed(
+        self,
+        advance_strategy: StrategyConfig,
+        basic_session_config: SessionConfig,
+    ) -> None:
+        """Same seed produces the same batch."""
+        first = run_sessions_vectorized(
+            advance_strategy, basic_session_config, 200, np.random.default_rng(3)
+        )
+        second = run_sessions_vectorized(
+            advance_strategy, basic_session_config, 200, np.random.default_rng(3)
+        )
+        np.testing.assert_array_equal(first.final_pnl, second.final_pnl)
+        np.testing.assert_array_equal(first.stop_code, second.stop_code)
+
+    def test_ladder_touches_use_narrow_dtype(
+        self,
+        advance_strategy: StrategyConfig,
+        basic_session_config: SessionConfig,
+    ) -> None:
+        """Touch counts are int16 unless max_rounds could overflow it."""
+        batch = run_sessions_vectorized(
+            advance_strategy, basic_session_config, 10, np.random.default_rng(0)
+        )
+        assert batch.ladder_touches.dtype == np.int16
+
+        long_config = replace(basic_session_config, max_rounds=40000)
+        batch = run_sessions_vectorized(
+            advance_strategy, long_config, 10, np.random.default_rng(0)
+        )
+        assert batch.ladder_touches.dtype == np.int32
+        assert np.all(batch.ladder_touches.sum(axis=1) == batch.rounds_played)
+
+
+class TestFirstPassage:
+    """First-passage records stand in for runs at smaller targets."""
+
+    def test_passage_matches_direct_run_per_target(
+        self,
+        recovery_strategy: StrategyConfig,
+        even_money_game: GameSpec,
+    ) -> None:
+        """Each target's outcome equals a run stopped at that target."""
+        targets = np.arange(100.0, 700.0, 100.0)
+
+        def config_for(target: float) -> SessionConfig:
+            return SessionConfig(
+                bankroll=10000.0,
+                profit_target=target,
+                stop_loss_abs=2000.0,
+                game_spec=even_money_game,
+                max_rounds=400,
+            )
+
+        for seed in range(15):
+            wide = run_sessions_vectorized(
+                recovery_strategy, config_for(targets[-1]), 1,
+                np.random.default_rng(seed), passage_targets=targets,
+            )
+            for k, target in enumerate(targets):
+                direct = run_sessions_vectorized(
+                    recovery_strategy, config_for(target), 1,
+                    np.random.default_rng(seed),
+                )
+                if wide.first_passage_round[0, k] > 0:
+                    assert direct.stop_code[0] == STOP_PROFIT_TARGET
+                    assert direct.rounds_played[0] == wide.first_passage_round[0, k]
+                    assert direct.final_pnl[0] == wide.first_passage_pnl[0, k]
+                else:
+                    assert direct.stop_code[0] == wide.stop_code[0]
+                    assert direct.final_pnl[0] == wide.final_pnl[0]
+
+    def test_search_grid_picks_largest_safe_target(
+        self,
+        recovery_strategy: StrategyConfig,
+        basic_session_config: SessionConfig,
+    ) -> None:
+        """The safe target is the largest grid point within alpha."""
+        finder = SafeTargetFinder(
+            recovery_strategy, basic_session_config, 300, alpha=0.2, seed=4
+        )
+        result = finder.search_grid(100.0, 500.0, 100.0, verbose=False)
+        safe = [
+            row["profit_target"] for row in result.trade_off_curve
+            if row["ruin_probability"] <= 0.2
+        ]
+        assert result.safe_target == max(safe)
+        ruin = [row["ruin_probability"] for row in result.trade_off_curve]
+        assert ruin == sorted(ruin)
+        assert len(result.trade_off_curve) == 5
+        assert result.results.n_sessions == 300
+
+
+class TestResultSerialization:
+    """Hand-built result dictionaries."""
+
+    def test_monte_carlo_to_dict_is_plain_json(
+        self,
+        recovery_strategy: StrategyConfig,
+        basic_session_config: SessionConfig,
+    ) -> None:
+        """to_dict has every summary field as plain Python numbers."""
+        results = MonteCarloEngine(
+            recovery_strategy, basic_session_config, 200, seed=5
+        ).run()
+        d = results.to_dict()
+
+        expected = [
+            f.name for f in fields(results)
+            if f.name not in ("all_pnls", "all_rounds")
+        ]
+        assert list(d) == expected
+        assert d["mean_pnl"] == results.mean_pnl
+        assert type(d["mean_pnl"]) is float
+        assert json.loads(json.dumps(d))["n_sessions"] == 200
+
+    def test_session_to_dict_lists_ladder_touches(
+        self,
+        recovery_strategy: StrategyConfig,
+        basic_session_config: SessionConfig,
+    ) -> None:
+        """Ladder touches are emitted as a list indexed by ladder."""
+        result = SessionSimulator(
+            recovery_strategy, basic_session_config, np.random.default_rng(1)
+        ).run()
+        d = result.to_dict()
+        assert d["ladder_touches"] == [
+            result.ladder_touches[i] for i in range(len(result.ladder_touches))
+        ]
+        assert d["final_pnl"] == result.final_pnl
+
+
+class TestSummaryHelpers:
+    """Single-pass moment and median helpers."""
+
+    def test_moments_match_numpy_and_scipy(self) -> None:
+        """Derived std, skew and kurtosis agree with the library functions."""
+        x = np.random.default_rng(0).exponential(size=1001)
+        mean, m2, m3, m4 = _moments(x)
+        n = len(x)
+        assert mean == pytest.approx(np.mean(x))
+        assert np.sqrt(m2 * n / (n - 1)) == pytest.approx(np.std(x, ddof=1))
+        assert m3 / m2**1.5 == pytest.approx(stats.skew(x))
+        assert m4 / m2**2 - 3.0 == pytest.approx(stats.kurtosis(x))
+
+    def test_constant_pnl_has_zero_shape_statistics(
+        self, advance_strategy: StrategyConfig
+    ) -> None:
+        """Identical sessions report zero skew and kurtosis instead of NaN."""
+        config = SessionConfig(
+            bankroll=10000.0,
+            profit_target=5000.0,
+            stop_loss_abs=5000.0,
+            game_spec=GameSpec(name="Sure win", payout_ratio=1.0, p_win=1.0),
+            max_rounds=1,
+        )
+        results = MonteCarloEngine(advance_strategy, config, 50, seed=0).run()
+        assert results.std_pnl == 0.0
+        assert results.skew_pnl == 0.0
+        assert results.kurtosis_pnl == 0.0
+
+    @pytest.mark.parametrize("n", [1, 6, 7])
+    def test_column_medians_match_np_median(self, n: int) -> None:
+        """Partition-based medians equal np.median for odd and even lengths."""
+        rng = np.random.default_rng(n)
+        pnls = rng.normal(size=n)
+        rounds = rng.integers(1, 100, size=n)
+        medians = _column_medians(pnls, rounds)
+        assert medians[0] == np.median(pnls)
+        assert medians[1] == np.median(rounds)
+
+
+class TestStreamingAggregator:
+    """Batch-by-batch aggregation of session results."""
+
+    def test_split_batches_match_single_batch(
+        self,
+        recovery_strategy: StrategyConfig,
+        basic_session_config: SessionConfig,
+    ) -> None:
+        """Folding parts one by one matches folding them joined."""
+        parts = [
+            run_sessions_vectorized(
+                recovery_strategy, basic_session_config, size,
+                np.random.default_rng(seed),
+            )
+            for seed, size in enumerate([120, 7, 301])
+        ]
+        n_ladders = len(recovery_strategy.ladders)
+
+        streamed = StreamingAggregator(n_ladders)
+        for part in parts:
+            streamed.update(part)
+        joined = StreamingAggregator(n_ladders)
+        joined.update(BatchSessionResults.concatenate(parts))
+
+        a = streamed.finalize().to_dict()
+        b = joined.finalize().to_dict()
+        assert a.keys() == b.keys()
+        for key in a:
+            assert a[key] == pytest.approx(b[key], rel=1e-9, abs=1e-9), key
+
+    def test_matches_direct_statistics(
+        self,
+        recovery_strategy: StrategyConfig,
+        basic_session_config: SessionConfig,
+    ) -> None:
+        """Finalized metrics agree with NumPy and scipy on the raw arrays."""
+        batch = run_sessions_vectorized(
+            recovery_strategy, basic_session_config, 400, np.random.default_rng(2)
+        )
+        aggregator = StreamingAggregator(len(recovery_strategy.ladders))
+        aggregator.update(batch)
+        results = aggregator.finalize(store_traces=True)
+
+        pnls = batch.final_pnl
+        assert results.n_sessions == 400
+        assert results.mean_pnl == pytest.approx(np.mean(pnls))
+        assert results.std_pnl == pytest.approx(np.std(pnls, ddof=1))
+        assert results.skew_pnl == pytest.approx(stats.skew(pnls))
+        assert results.kurtosis_pnl == pytest.approx(stats.kurtosis(pnls))
+        assert results.median_rounds == np.median(batch.rounds_played)
+        assert results.prob_hit_target == np.mean(batch.hit_target)
+        np.testing.assert_array_equal(results.all_pnls, pnls)
+
+
+class TestParallelEngine:
+    """MonteCarloEngine spread over worker processes."""
+
+    def test_parallel_run_is_reproducible(
+        self,
+        recovery_strategy: StrategyConfig,
+        basic_session_config: SessionConfig,
+    ) -> None:
+        """Same seed and n_jobs repeat the same aggregate results."""
+        first = MonteCarloEngine(
+            recovery_strategy, basic_session_config, 301, seed=9, n_jobs=2
+        ).run()
+        second = MonteCarloEngine(
+            recovery_strategy, basic_session_config, 301, seed=9, n_jobs=2
+        ).run()
+        assert first.n_sessions == 301
+        assert first.to_dict() == second.to_dict()
+
+    def test_concatenate_keeps_session_order(
+        self,
+        advance_strategy: StrategyConfig,
+        basic_session_config: SessionConfig,
+    ) -> None:
+        """Concatenated batches line up with the parts they came from."""
+        a = run_sessions_vectorized(
+            advance_strategy, basic_session_config, 5, np.random.default_rng(1)
+        )
+        b = run_sessions_vectorized(
+            advance_strategy, basic_session_config, 3, np.random.default_rng(2)
+        )
+        joined = BatchSessionResults.concatenate([a, b])
+        np.testing.assert_array_equal(
+            joined.final_pnl, np.concatenate([a.final_pnl, b.final_pnl])
+        )
+        assert joined.ladder_touches.shape == (8, a.ladder_touches.shape[1])
+
+
+class TestSeedingUtilities:
+    """Per-session generators and bulk uniform draws."""
+
+    def test_session_rngs_are_reproducible_and_distinct(self) -> None:
+        """Same master seed repeats streams; sessions differ from each other."""
+        first = [rng.random(4) for rng in make_session_rngs(11, 3)]
+        again = [rng.random(4) for rng in make_session_rngs(11, 3)]
+        for a, b in zip(first, again):
+            np.testing.assert_array_equal(a, b)
+        assert not np.array_equal(first[0], first[1])
+
+    def test_make_rng_uses_pcg64dxsm(self) -> None:
+        """Engine generators are PCG64DXSM and reproducible from the seed."""
+        rng = make_rng(5)
+        assert isinstance(rng.bit_generator, np.random.PCG64DXSM)
+        np.testing.assert_array_equal(rng.random(3), make_rng(5).random(3))
+
+    def test_engine_accepts_existing_generator(
+        self,
+        advance_strategy: StrategyConfig,
+        basic_session_config: SessionConfig,
+    ) -> None:
+        """Passing make_rng(seed) as rng is the same as passing seed."""
+        seeded = MonteCarloEngine(
+            advance_strategy, basic_session_config, 100, seed=8
+        ).run()
+        shared = MonteCarloEngine(
+            advance_strategy, basic_session_config, 100, rng=make_rng(8)
+        ).run()
+        assert seeded.to_dict() == shared.to_dict()
+
+    def test_bulk_uniforms_shape_and_range(self) -> None:
+        """Bulk draws have the requested shape and lie in [0, 1)."""
+        u = bulk_uniforms(3, (5, 7))
+        assert u.shape == (5, 7)
+        assert u.dtype == np.float64
+        assert np.all((u >= 0) & (u < 1))
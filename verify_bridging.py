@@ -26,9 +26,7 @@ def verify_carry_over_logic():
     
     # 1. Force loss at top of L1
     print("\n--- Step 1: Force loss at top of L1 ---")
-    sim.current_ladder = 0
-    sim.current_index = 2  # Top of L1 (stake 30)
-    sim.pnl = -50.0 # Assume we lost some already
+    sim.reset_state(ladder=0, index=2, pnl=-50.0)  # Top of L1 (stake 30), some loss already
     
     print(f"Before bridging: Ladder {sim.current_ladder}, Index {sim.current_index}, PnL {sim.pnl}")
     
@@ -77,5 +75,87 @@ def verify_carry_over_logic():
     assert sim.in_recovery == False, "Should clear recovery mode"
     print("✓ Recovery completion correct")
 
+def verify_batch(strategy, scenarios):
+    """
+    Apply one carry_over_index_delta step to many scenarios at once.
+
+    ``scenarios`` is an (N, 4) array of [ladder, index, pnl, won] rows, each
+    starting outside recovery mode. Returns the post-step
+    (ladder, index, in_recovery, recovery_target, stopped) arrays.
+    """
+    ladder = scenarios[:, 0].astype(np.int64)
+    index = scenarios[:, 1].astype(np.int64)
+    pnl = scenarios[:, 2]
+    won = scenarios[:, 3] != 0
+
+    top = strategy._max_index[ladder]
+    bridge = ~won & (index == top)
+    last = ladder == len(strategy.ladders) - 1
+
+    # Ordinary step: down 2 on a win, up 1 on a loss, clamped to the ladder
+    new_index = np.clip(index + np.where(won, -2, 1), 0, top)
+    new_ladder = ladder.copy()
+
+    # Loss at the top: enter recovery, then carry over (or stop on the last)
+    stopped = bridge & last
+    carried = bridge & ~last
+    new_index[stopped] = top[stopped] + 1
+    new_index[carried] = strategy.crossover_offset
+    new_ladder[carried] += 1
+    target = np.where(
+        bridge,
+        np.where(pnl < 0, pnl + np.abs(pnl) * strategy.recovery_target_pct, pnl),
+        0.0,
+    )
+    return new_ladder, new_index, bridge, target, stopped
+
+
+def verify_carry_over_batch(n_scenarios=1000, seed=0):
+    print(f"\nVerifying {n_scenarios} random carry_over_index_delta steps...")
+
+    ladders = [
+        LadderSpec("L1", [10, 20, 30]),
+        LadderSpec("L2", [100, 200, 300, 400]),
+        LadderSpec("L3", [1000, 2000]),
+    ]
+    strategy = StrategyConfig(
+        ladders=ladders,
+        bridging_policy="carry_over_index_delta",
+        recovery_target_pct=0.5,
+        crossover_offset=1
+    )
+    game = GameSpec(name="even_money", payout_ratio=1.0, p_win=0.495)
+    config = SessionConfig(bankroll=10000, profit_target=1000, stop_loss_abs=1000, game_spec=game)
+    sim = SessionSimulator(strategy, config, np.random.default_rng(seed))
+
+    rng = np.random.default_rng(seed)
+    ladder = rng.integers(0, len(ladders), n_scenarios)
+    scenarios = np.column_stack([
+        ladder,
+        rng.integers(0, strategy._max_index[ladder] + 1),
+        rng.uniform(-500, 500, n_scenarios).round(2),
+        rng.integers(0, 2, n_scenarios),
+    ]).astype(np.float64)
+
+    expected = verify_batch(strategy, scenarios)
+
+    # Reference: the scalar simulator, one step per scenario
+    actual = np.empty((n_scenarios, 5))
+    for row, (lad, idx, pnl, won) in enumerate(scenarios):
+        sim.reset_state(ladder=int(lad), index=int(idx), pnl=pnl)
+        sim.step_index(won=bool(won))
+        actual[row] = (
+            sim.current_ladder,
+            sim.current_index,
+            sim.in_recovery,
+            sim.recovery_target_pnl,
+            sim.stopped,
+        )
+
+    for column, name in enumerate(["ladder", "index", "in_recovery", "target", "stopped"]):
+        np.testing.assert_array_equal(actual[:, column], expected[column], err_msg=name)
+    print(f"✓ {n_scenarios} scenarios match the scalar simulator")
+
 if __name__ == "__main__":
     verify_carry_over_logic()
+    verify_carry_over_batch()